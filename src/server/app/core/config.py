@@ -8,6 +8,9 @@ import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
+# Prefer libyaml's C loader when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class DocumentsConfig(BaseModel):
     """Document processing configuration."""
@@ -110,6 +113,11 @@ def find_git_root() -> Path:
         return Path(__file__).parent.parent.parent.parent.parent
 
 
+def load_config_from_string(text: str) -> dict[str, Any]:
+    """Parse configuration from YAML text."""
+    return yaml.load(text, Loader=YamlLoader) or {}  # noqa: S506
+
+
 def load_config_file(git_root: Path) -> dict[str, Any]:
     """Load configuration from YAML file in git root."""
     config_path = git_root / "specmgr.config.yaml"
@@ -118,8 +126,7 @@ def load_config_file(git_root: Path) -> dict[str, Any]:
         return {}
 
     try:
-        with open(config_path, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        return load_config_from_string(config_path.read_text(encoding="utf-8"))
     except Exception as e:
         print(f"Warning: Failed to load config file {config_path}: {e}")  # noqa: T201
         return {}
@@ -1,7 +1,9 @@
 """ファイルサービス."""
 
 import hashlib
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from app.core.config import settings
@@ -12,6 +14,22 @@ from app.models.api_models import (
     FilesResponse,
 )
 
+# 更新時刻がこの範囲内のファイルは同じタイムスタンプ内で再度書き換えられる
+# 可能性があるため、ハッシュをキャッシュしない
+_MTIME_RACE_WINDOW_NS = 2_000_000_000
+
+
+def _read_file_hash(path: str) -> str:
+    """ファイルのSHA-1ハッシュを計算."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, hashlib.sha1).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _hash_file(path: str, mtime_ns: int, size: int) -> str:
+    """ファイルのSHA-1ハッシュを計算 (パス・更新時刻・サイズでキャッシュ)."""
+    return _read_file_hash(path)
+
 
 class FileService:
     """ファイル管理サービス."""
@@ -173,12 +191,12 @@ class FileService:
 
     async def _calculate_file_hash(self, file_path: Path) -> str:
         """ファイルのSHA-1ハッシュを計算."""
-        hasher = hashlib.sha1()  # noqa: S324
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+            stat = file_path.stat()
+            if time.time_ns() - stat.st_mtime_ns < _MTIME_RACE_WINDOW_NS:
+                # 直近に更新されたファイルは同サイズの再書き込みを見逃さないよう毎回計算
+                return _read_file_hash(str(file_path))
+            return _hash_file(str(file_path), stat.st_mtime_ns, stat.st_size)
         except Exception:
             return ""
 
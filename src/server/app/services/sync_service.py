@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,13 @@ from app.services.qdrant_service import QdrantService
 # モジュールレベルでloggerを初期化
 logger = logging.getLogger(__name__)
 
+# Directory mtimes newer than this may still change within the same timestamp
+# tick, so walks that saw them are not cached
+_MTIME_RACE_WINDOW_NS = 2_000_000_000
+
+# (docs root, directory mtimes, markdown files) of the last cached walk
+MarkdownListing = tuple[Path, dict[Path, int], list[Path]]
+
 
 class SyncError(Exception):
     """Synchronization operation specific error."""
@@ -44,6 +52,7 @@ class SyncService:
             "total": 0,
             "current_file": "",
         }
+        self._markdown_files_cache: MarkdownListing | None = None
 
     async def execute_bulk_sync(self, force: bool = False) -> BulkSyncResult:
         """
@@ -133,40 +142,53 @@ class SyncService:
 
                 await asyncio.sleep(0.05)
 
-            # Process sync files
-            for i, relative_path in enumerate(files_to_sync):
-                self._sync_status["current"] = len(files_to_delete) + i + 1
-                self._sync_status["current_file"] = relative_path
-
-                file_path = self.docs_path / relative_path
-
-                try:
-                    await self.sync_file(str(file_path))
-                    # Update manifest with new hash
-                    await self.manifest_service.update_file_in_manifest(
-                        relative_path, current_files[relative_path]
-                    )
-                    processed_files += 1
-
-                    # Estimate chunk count from file size
-                    file_size = file_path.stat().st_size
-                    estimated_chunks = max(1, file_size // 1000)
-                    total_chunks += estimated_chunks
-
-                    await asyncio.sleep(0.05)
+            # Process sync files concurrently (bounded by queue concurrency)
+            semaphore = asyncio.Semaphore(settings.app_config.queue.concurrency)
+            # The manifest is load-modify-save, so updates must not interleave
+            manifest_lock = asyncio.Lock()
+
+            async def sync_one(relative_path: str) -> int:
+                """Sync one file and return its estimated chunk count."""
+                async with semaphore:
+                    self._sync_status["current_file"] = relative_path
+                    file_path = self.docs_path / relative_path
+                    try:
+                        await self.sync_file(file_path)
+                        # Update manifest with new hash
+                        async with manifest_lock:
+                            await self.manifest_service.update_file_in_manifest(
+                                relative_path, current_files[relative_path]
+                            )
+
+                        # Estimate chunk count from file size
+                        file_size = file_path.stat().st_size
+                        return max(1, file_size // 1000)
+                    finally:
+                        self._sync_status["current"] += 1
+
+            results = await asyncio.gather(
+                *(sync_one(relative_path) for relative_path in files_to_sync),
+                return_exceptions=True,
+            )
 
-                except Exception as e:
-                    error_msg = f"{relative_path}: {str(e)}"
+            for relative_path, result in zip(files_to_sync, results, strict=True):
+                if isinstance(result, Exception):
+                    error_msg = f"{relative_path}: {str(result)}"
                     errors.append(error_msg)
                     logger.error(
                         "Failed to sync file during bulk sync",
                         extra={
                             "file_path": relative_path,
-                            "error": str(e),
-                            "error_type": type(e).__name__,
+                            "error": str(result),
+                            "error_type": type(result).__name__,
                             "operation": "sync_process_file",
                         },
                     )
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    processed_files += 1
+                    total_chunks += result
 
             processing_time = time.time() - start_time
 
@@ -201,6 +223,15 @@ class SyncService:
         """
         Get sync status.
 
+        Returns:
+            Sync status
+        """
+        return self.status_snapshot()
+
+    def status_snapshot(self) -> SyncStatus:
+        """
+        Get a snapshot of the current sync status without awaiting.
+
         Returns:
             Sync status
         """
@@ -211,20 +242,21 @@ class SyncService:
             currentFile=self._sync_status["current_file"],
         )
 
-    async def sync_file(self, file_path: str) -> None:
+    async def sync_file(self, file_path: str | os.PathLike[str]) -> None:
         """
         File sync processing.
 
         Args:
             file_path: Target file path for sync
         """
+        path = file_path if isinstance(file_path, Path) else Path(file_path)
         try:
             # ファイル読み込み
-            with open(file_path, encoding="utf-8") as f:
+            with open(path, encoding="utf-8") as f:
                 content = f.read()
 
             # 相対パスを取得
-            relative_path = str(Path(file_path).relative_to(self.docs_path))
+            relative_path = str(path.relative_to(self.docs_path))
 
             # ベクトル化を実行（APIキーがない場合はダミーベクトルを使用）
             try:
@@ -265,7 +297,7 @@ class SyncService:
             logger.error(
                 "Failed to sync file",
                 extra={
-                    "file_path": file_path,
+                    "file_path": os.fspath(file_path),
                     "error": str(e),
                     "error_type": type(e).__name__,
                     "operation": "sync_file",
@@ -287,7 +319,7 @@ class SyncService:
             return {}
 
         file_hashes = {}
-        markdown_files = list(self.docs_path.rglob("*.md"))
+        markdown_files = self._list_markdown_files()
 
         for file_path in markdown_files:
             try:
@@ -308,6 +340,61 @@ class SyncService:
 
         return file_hashes
 
+    def _list_markdown_files(self) -> list[Path]:
+        """
+        List markdown files under docs_path.
+
+        The previous walk is reused while every directory it visited keeps
+        the same mtime, so an unchanged tree costs one stat per directory.
+        Walks that saw a recently modified directory or skipped an unreadable
+        one are not cached. The cache lives on the instance, so it only pays
+        off for long-lived instances such as the scheduler's; the API
+        endpoints and queue jobs build a fresh SyncService per call.
+
+        Returns:
+            Markdown file paths
+        """
+        if self._markdown_files_cache is not None:
+            root, dir_mtimes, markdown_files = self._markdown_files_cache
+            try:
+                if root == self.docs_path and all(
+                    directory.stat().st_mtime_ns == mtime_ns
+                    for directory, mtime_ns in dir_mtimes.items()
+                ):
+                    return list(markdown_files)
+            except OSError:
+                pass
+
+        scan_started_ns = time.time_ns()
+        complete = True
+        dir_mtimes = {}
+        markdown_files = []
+        directories = [self.docs_path]
+        while directories:
+            directory = directories.pop()
+            try:
+                # Stat before scanning so a concurrent change invalidates the cache
+                dir_mtimes[directory] = directory.stat().st_mtime_ns
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            directories.append(Path(entry.path))
+                        elif entry.name.endswith(".md") and entry.is_file():
+                            markdown_files.append(Path(entry.path))
+            except OSError:
+                # Skip directories removed or made unreadable mid-walk, like rglob
+                complete = False
+                continue
+
+        cacheable = complete and all(
+            mtime_ns < scan_started_ns - _MTIME_RACE_WINDOW_NS
+            for mtime_ns in dir_mtimes.values()
+        )
+        self._markdown_files_cache = (
+            (self.docs_path, dir_mtimes, markdown_files) if cacheable else None
+        )
+        return list(markdown_files)
+
     async def remove_file(self, file_path: str) -> None:
         """
         File removal processing.
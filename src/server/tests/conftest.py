@@ -1,30 +1,50 @@
 """Pytest configuration and shared fixtures."""
 
 import asyncio
+import gc
+import importlib.util
 import tempfile
 from collections.abc import AsyncGenerator, Generator
+from datetime import datetime
 from pathlib import Path
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app.models.api_models import FileMetadata, SearchResult
-from main import app
+
+SAMPLE_TIMESTAMP = datetime(2025, 1, 1)
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the session event loop on uvloop when it is installed."""
+    # uvicorn[standard] skips uvloop on Windows
+    if importlib.util.find_spec("uvloop") is None:
+        return asyncio.DefaultEventLoopPolicy()
 
+    import uvloop
 
-@pytest.fixture
+    policy: asyncio.AbstractEventLoopPolicy = uvloop.EventLoopPolicy()
+    return policy
+
+
+@pytest.fixture(scope="session", autouse=True)
+def disable_gc() -> Generator[None, None, None]:
+    """Disable cyclic GC for the session and collect once at teardown."""
+    gc.disable()
+    yield
+    gc.enable()
+    gc.collect()
+
+
+@pytest.fixture(scope="session")
 def test_client() -> TestClient:
-    """Create FastAPI test client."""
+    """Create FastAPI test client shared across the session."""
+    from main import app
+
     return TestClient(app)
 
 
@@ -83,6 +103,83 @@ Content for testing nested file handling."""
         yield docs_dir
 
 
+@pytest.fixture(scope="session")
+def service_stubs() -> dict[str, MagicMock]:
+    """Spec'd service stubs built once and shared by the API endpoint tests."""
+    from app.services.chat_service import ChatService
+    from app.services.file_service import FileService
+    from app.services.health_service import HealthService
+    from app.services.search_service import SearchService
+    from app.services.sync_service import SyncService
+
+    return {
+        "chat": MagicMock(spec_set=ChatService),
+        "files": MagicMock(spec_set=FileService),
+        "health": MagicMock(spec_set=HealthService),
+        "search": MagicMock(spec_set=SearchService),
+        "sync": MagicMock(spec_set=SyncService),
+    }
+
+
+def _patch_endpoint_service(
+    target: str, stub: MagicMock
+) -> Generator[MagicMock, None, None]:
+    """Make an endpoint's service constructor return stub, then reset it."""
+    with patch(target, return_value=stub):
+        yield stub
+    stub.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def chat_service_stub(
+    service_stubs: dict[str, MagicMock],
+) -> Generator[MagicMock, None, None]:
+    """ChatService stub used by the chat endpoints."""
+    yield from _patch_endpoint_service(
+        "app.api.endpoints.chat.ChatService", service_stubs["chat"]
+    )
+
+
+@pytest.fixture
+def file_service_stub(
+    service_stubs: dict[str, MagicMock],
+) -> Generator[MagicMock, None, None]:
+    """FileService stub used by the files endpoints."""
+    yield from _patch_endpoint_service(
+        "app.api.endpoints.files.FileService", service_stubs["files"]
+    )
+
+
+@pytest.fixture
+def health_service_stub(
+    service_stubs: dict[str, MagicMock],
+) -> Generator[MagicMock, None, None]:
+    """HealthService stub used by the health endpoints."""
+    yield from _patch_endpoint_service(
+        "app.api.endpoints.health.HealthService", service_stubs["health"]
+    )
+
+
+@pytest.fixture
+def search_service_stub(
+    service_stubs: dict[str, MagicMock],
+) -> Generator[MagicMock, None, None]:
+    """SearchService stub used by the search endpoints."""
+    yield from _patch_endpoint_service(
+        "app.api.endpoints.search.SearchService", service_stubs["search"]
+    )
+
+
+@pytest.fixture
+def sync_service_stub(
+    service_stubs: dict[str, MagicMock],
+) -> Generator[MagicMock, None, None]:
+    """SyncService stub used by the sync endpoints."""
+    yield from _patch_endpoint_service(
+        "app.api.endpoints.sync.SyncService", service_stubs["sync"]
+    )
+
+
 @pytest.fixture
 def mock_settings() -> Generator[Mock, None, None]:
     """Mock application settings for testing."""
@@ -220,8 +317,6 @@ async def mock_async_services() -> AsyncGenerator[
 @pytest.fixture
 def sample_file_metadata() -> FileMetadata:
     """Sample file metadata for testing."""
-    from datetime import datetime
-
     from app.models.api_models import FileMetadata
 
     return FileMetadata(
@@ -230,8 +325,8 @@ def sample_file_metadata() -> FileMetadata:
         relativePath="test.md",
         directory="/docs",
         size=1024,
-        lastModified=datetime.now(),
-        created=datetime.now(),
+        lastModified=SAMPLE_TIMESTAMP,
+        created=SAMPLE_TIMESTAMP,
         hash="abc123def456",
         lineCount=20,
         wordCount=150,
@@ -1,25 +1,16 @@
 """Chat API endpoint tests."""
 
 from collections.abc import AsyncGenerator
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock
 
-import pytest
 from fastapi.testclient import TestClient
 
-from main import app
-
 
 class TestChatAPI:
     """Chat API endpoint test class."""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client."""
-        return TestClient(app)
-
-    @patch("app.services.chat_service.ChatService.chat_stream")
     def test_chat_stream_success(
-        self, mock_chat_stream: Mock, client: TestClient
+        self, chat_service_stub: MagicMock, test_client: TestClient
     ) -> None:
         """Test successful chat streaming."""
 
@@ -28,9 +19,9 @@ class TestChatAPI:
             yield " "
             yield "World"
 
-        mock_chat_stream.return_value = mock_stream()
+        chat_service_stub.chat_stream.return_value = mock_stream()
 
-        response = client.post(
+        response = test_client.post(
             "/api/chat/stream",
             json={
                 "message": "Hello",
@@ -49,18 +40,17 @@ class TestChatAPI:
         assert '"type":"complete"' in content
         assert '"type":"done"' in content
 
-    @patch("app.services.chat_service.ChatService.chat_stream")
     def test_chat_stream_with_history(
-        self, mock_chat_stream: Mock, client: TestClient
+        self, chat_service_stub: MagicMock, test_client: TestClient
     ) -> None:
         """Test chat streaming with conversation history."""
 
         async def mock_stream() -> AsyncGenerator[str, None]:
             yield "Response"
 
-        mock_chat_stream.return_value = mock_stream()
+        chat_service_stub.chat_stream.return_value = mock_stream()
 
-        response = client.post(
+        response = test_client.post(
             "/api/chat/stream",
             json={
                 "message": "Follow up question",
@@ -81,16 +71,15 @@ class TestChatAPI:
         )
 
         assert response.status_code == 200
-        mock_chat_stream.assert_called_once()
+        chat_service_stub.chat_stream.assert_called_once()
 
-    @patch("app.services.chat_service.ChatService.chat_stream")
     def test_chat_stream_service_error(
-        self, mock_chat_stream: Mock, client: TestClient
+        self, chat_service_stub: MagicMock, test_client: TestClient
     ) -> None:
         """Test chat streaming with service error."""
-        mock_chat_stream.side_effect = Exception("Chat service error")
+        chat_service_stub.chat_stream.side_effect = Exception("Chat service error")
 
-        response = client.post(
+        response = test_client.post(
             "/api/chat/stream",
             json={
                 "message": "Test message",
@@ -107,15 +96,15 @@ class TestChatAPI:
             # Check if error is in the stream content
             assert '"type":"error"' in response.text
 
-    def test_chat_stream_invalid_request(self, client: TestClient) -> None:
+    def test_chat_stream_invalid_request(self, test_client: TestClient) -> None:
         """Test chat streaming with invalid request data."""
-        response = client.post("/api/chat/stream", json={})
+        response = test_client.post("/api/chat/stream", json={})
 
         assert response.status_code == 422  # Validation error
 
-    def test_chat_stream_missing_message(self, client: TestClient) -> None:
+    def test_chat_stream_missing_message(self, test_client: TestClient) -> None:
         """Test chat streaming with missing message field."""
-        response = client.post(
+        response = test_client.post(
             "/api/chat/stream",
             json={
                 "conversationHistory": [],
@@ -1,25 +1,20 @@
 """File API endpoint tests."""
 
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
+from app.api.endpoints.files import get_file_content, get_files
 from app.models.api_models import FileContent, FileMetadata, FilesResponse
-from main import app
 
 
 class TestFilesAPI:
     """File API endpoint test class."""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client."""
-        return TestClient(app)
-
-    @patch("app.services.file_service.FileService.get_files")
-    def test_get_files_success(self, mock_get_files: Mock, client: TestClient) -> None:
+    async def test_get_files_success(self, file_service_stub: MagicMock) -> None:
         """Test successful file list retrieval."""
         # Mock response
         mock_response = FilesResponse(
@@ -40,29 +35,29 @@ class TestFilesAPI:
             directories=[],
             totalCount=1,
         )
-        mock_get_files.return_value = mock_response
+        file_service_stub.get_files.return_value = mock_response
 
-        # Execute request
-        response = client.get("/api/files")
+        # Execute handler
+        response = await get_files(
+            path=None, recursive=True, sort_by="name", order="asc"
+        )
 
         # Verify response
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert "data" in data
-        assert len(data["data"]["files"]) == 1
-        assert data["data"]["files"][0]["name"] == "test.md"
+        assert response.success is True
+        assert response.data == mock_response
+        file_service_stub.get_files.assert_called_once_with(
+            path=None, recursive=True, sort_by="name", order="asc"
+        )
 
-    @patch("app.services.file_service.FileService.get_files")
     def test_get_files_with_params(
-        self, mock_get_files: Mock, client: TestClient
+        self, file_service_stub: MagicMock, test_client: TestClient
     ) -> None:
         """Test file list retrieval with parameters."""
-        mock_get_files.return_value = FilesResponse(
+        file_service_stub.get_files.return_value = FilesResponse(
             files=[], directories=[], totalCount=0
         )
 
-        response = client.get(
+        response = test_client.get(
             "/api/files",
             params={
                 "path": "/docs",
@@ -73,13 +68,22 @@ class TestFilesAPI:
         )
 
         assert response.status_code == 200
-        mock_get_files.assert_called_once_with(
+        file_service_stub.get_files.assert_called_once_with(
             path="/docs", recursive=True, sort_by="modified", order="desc"
         )
 
-    @patch("app.services.file_service.FileService.get_file_content")
+    async def test_get_files_server_error(self, file_service_stub: MagicMock) -> None:
+        """Test server error handling."""
+        file_service_stub.get_files.side_effect = Exception("Database error")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_files(path=None, recursive=True, sort_by="name", order="asc")
+
+        assert exc_info.value.status_code == 500
+        assert "File list retrieval error" in exc_info.value.detail
+
     def test_get_file_content_success(
-        self, mock_get_content: Mock, client: TestClient
+        self, file_service_stub: MagicMock, test_client: TestClient
     ) -> None:
         """Test successful file content retrieval."""
         mock_content = FileContent(
@@ -99,35 +103,25 @@ class TestFilesAPI:
                 wordCount=3,
             ),
         )
-        mock_get_content.return_value = mock_content
+        file_service_stub.get_file_content.return_value = mock_content
 
-        response = client.get("/api/files/docs%2Ftest.md")
+        response = test_client.get("/api/files/docs%2Ftest.md")
 
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert data["data"]["content"] == "# Test\nContent"
 
-    @patch("app.services.file_service.FileService.get_file_content")
-    def test_get_file_content_not_found(
-        self, mock_get_content: Mock, client: TestClient
+    async def test_get_file_content_not_found(
+        self, file_service_stub: MagicMock
     ) -> None:
         """Test file not found error."""
-        mock_get_content.side_effect = FileNotFoundError("File not found")
-
-        response = client.get("/api/files/nonexistent.md")
-
-        assert response.status_code == 404
-        assert "File not found" in response.json()["detail"]
-
-    @patch("app.services.file_service.FileService.get_files")
-    def test_get_files_server_error(
-        self, mock_get_files: Mock, client: TestClient
-    ) -> None:
-        """Test server error handling."""
-        mock_get_files.side_effect = Exception("Database error")
+        file_service_stub.get_file_content.side_effect = FileNotFoundError(
+            "File not found"
+        )
 
-        response = client.get("/api/files")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_file_content("nonexistent.md")
 
-        assert response.status_code == 500
-        assert "File list retrieval error" in response.json()["detail"]
+        assert exc_info.value.status_code == 404
+        assert "File not found" in exc_info.value.detail
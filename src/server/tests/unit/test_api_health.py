@@ -1,48 +1,65 @@
 """Health API endpoint tests."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
+from app.api.endpoints.health import get_detailed_health
 from app.models.api_models import HealthStatus
-from main import app
 
 
 class TestHealthAPI:
     """Health API endpoint test class."""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client."""
-        return TestClient(app)
+    @pytest.mark.parametrize(
+        "mock_status",
+        [
+            pytest.param(
+                HealthStatus(textSearch=True, claudeCode=True, overall=True),
+                id="success",
+            ),
+            pytest.param(
+                HealthStatus(textSearch=True, claudeCode=False, overall=False),
+                id="partial_failure",
+            ),
+        ],
+    )
+    async def test_get_detailed_health(
+        self, health_service_stub: MagicMock, mock_status: HealthStatus
+    ) -> None:
+        """Test detailed health status retrieval."""
+        health_service_stub.get_detailed_health.return_value = mock_status
+
+        response = await get_detailed_health()
 
-    @patch("app.services.health_service.HealthService.get_detailed_health")
-    def test_get_detailed_health_success(
-        self, mock_get_health: Mock, client: TestClient
+        assert response.success is True
+        assert response.data == mock_status
+
+    async def test_get_detailed_health_error(
+        self, health_service_stub: MagicMock
     ) -> None:
-        """Test successful detailed health status retrieval."""
-        mock_status = HealthStatus(textSearch=True, claudeCode=True, overall=True)
-        mock_get_health.return_value = mock_status
+        """Test health check error handling."""
+        health_service_stub.get_detailed_health.side_effect = Exception(
+            "Health service error"
+        )
 
-        response = client.get("/api/health/detailed")
+        with pytest.raises(HTTPException) as exc_info:
+            await get_detailed_health()
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["data"]["textSearch"] is True
-        assert data["data"]["claudeCode"] is True
-        assert data["data"]["overall"] is True
+        assert exc_info.value.status_code == 500
+        assert "Health status retrieval error" in exc_info.value.detail
 
-    @patch("app.services.health_service.HealthService.get_detailed_health")
-    def test_get_detailed_health_partial_failure(
-        self, mock_get_health: Mock, client: TestClient
+    def test_get_detailed_health_http(
+        self, health_service_stub: MagicMock, test_client: TestClient
     ) -> None:
-        """Test health status with partial service failures."""
-        mock_status = HealthStatus(textSearch=True, claudeCode=False, overall=False)
-        mock_get_health.return_value = mock_status
+        """Test health status serialization over HTTP."""
+        health_service_stub.get_detailed_health.return_value = HealthStatus(
+            textSearch=True, claudeCode=False, overall=False
+        )
 
-        response = client.get("/api/health/detailed")
+        response = test_client.get("/api/health/detailed")
 
         assert response.status_code == 200
         data = response.json()
@@ -50,15 +67,3 @@ class TestHealthAPI:
         assert data["data"]["textSearch"] is True
         assert data["data"]["claudeCode"] is False
         assert data["data"]["overall"] is False
-
-    @patch("app.services.health_service.HealthService.get_detailed_health")
-    def test_get_detailed_health_error(
-        self, mock_get_health: Mock, client: TestClient
-    ) -> None:
-        """Test health check error handling."""
-        mock_get_health.side_effect = Exception("Health service error")
-
-        response = client.get("/api/health/detailed")
-
-        assert response.status_code == 500
-        assert "Health status retrieval error" in response.json()["detail"]
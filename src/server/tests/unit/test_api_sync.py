@@ -1,144 +1,134 @@
 """Sync API endpoint tests."""
 
-from unittest.mock import Mock, patch
+import json
+from unittest.mock import MagicMock
 
 import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
-from app.models.api_models import BulkSyncResult, SyncStatus
-from main import app
+from app.api.endpoints.sync import execute_bulk_sync, get_sync_status
+from app.models.api_models import BulkSyncRequest, BulkSyncResult, SyncStatus
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+FORCE_SYNC_BODY = json.dumps({"force": True}).encode()
 
 
 class TestSyncAPI:
     """Sync API endpoint test class."""
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create test client."""
-        return TestClient(app)
-
-    @patch("app.services.sync_service.SyncService.execute_bulk_sync")
-    def test_execute_bulk_sync_success(
-        self, mock_sync: Mock, client: TestClient
+    @pytest.mark.parametrize(
+        ("force", "mock_result"),
+        [
+            pytest.param(
+                False,
+                BulkSyncResult(
+                    success=True,
+                    totalFiles=10,
+                    processedFiles=10,
+                    totalChunks=50,
+                    processingTime=5.23,
+                    errors=[],
+                ),
+                id="success",
+            ),
+            pytest.param(
+                True,
+                BulkSyncResult(
+                    success=True,
+                    totalFiles=5,
+                    processedFiles=5,
+                    totalChunks=25,
+                    processingTime=2.5,
+                    errors=[],
+                ),
+                id="with_force",
+            ),
+            pytest.param(
+                False,
+                BulkSyncResult(
+                    success=False,
+                    totalFiles=10,
+                    processedFiles=8,
+                    totalChunks=40,
+                    processingTime=4.1,
+                    errors=["Error processing file1.md", "Error processing file2.md"],
+                ),
+                id="with_errors",
+            ),
+        ],
+    )
+    async def test_execute_bulk_sync(
+        self, sync_service_stub: MagicMock, force: bool, mock_result: BulkSyncResult
     ) -> None:
-        """Test successful bulk sync execution."""
-        mock_result = BulkSyncResult(
-            success=True,
-            totalFiles=10,
-            processedFiles=10,
-            totalChunks=50,
-            processingTime=5.23,
-            errors=[],
-        )
-        mock_sync.return_value = mock_result
+        """Test bulk sync execution results."""
+        sync_service_stub.execute_bulk_sync.return_value = mock_result
 
-        response = client.post("/api/sync/bulk", json={"force": False})
+        response = await execute_bulk_sync(BulkSyncRequest(force=force))
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["data"]["success"] is True
-        assert data["data"]["totalFiles"] == 10
-        assert data["data"]["processedFiles"] == 10
-        assert len(data["data"]["errors"]) == 0
-        mock_sync.assert_called_once_with(force=False)
+        assert response.success is True
+        assert response.data == mock_result
+        sync_service_stub.execute_bulk_sync.assert_called_once_with(force=force)
 
-    @patch("app.services.sync_service.SyncService.execute_bulk_sync")
-    def test_execute_bulk_sync_with_force(
-        self, mock_sync: Mock, client: TestClient
-    ) -> None:
-        """Test bulk sync execution with force flag."""
-        mock_result = BulkSyncResult(
-            success=True,
-            totalFiles=5,
-            processedFiles=5,
-            totalChunks=25,
-            processingTime=2.5,
-            errors=[],
+    async def test_execute_bulk_sync_error(self, sync_service_stub: MagicMock) -> None:
+        """Test bulk sync error handling."""
+        sync_service_stub.execute_bulk_sync.side_effect = Exception(
+            "Sync service error"
         )
-        mock_sync.return_value = mock_result
 
-        response = client.post("/api/sync/bulk", json={"force": True})
+        with pytest.raises(HTTPException) as exc_info:
+            await execute_bulk_sync(BulkSyncRequest(force=False))
 
-        assert response.status_code == 200
-        mock_sync.assert_called_once_with(force=True)
+        assert exc_info.value.status_code == 500
+        assert "一括同期エラー" in exc_info.value.detail
 
-    @patch("app.services.sync_service.SyncService.execute_bulk_sync")
-    def test_execute_bulk_sync_with_errors(
-        self, mock_sync: Mock, client: TestClient
+    def test_execute_bulk_sync_http(
+        self, sync_service_stub: MagicMock, test_client: TestClient
     ) -> None:
-        """Test bulk sync execution with some errors."""
-        mock_result = BulkSyncResult(
-            success=False,
+        """Test bulk sync request parsing and serialization over HTTP."""
+        sync_service_stub.execute_bulk_sync.return_value = BulkSyncResult(
+            success=True,
             totalFiles=10,
-            processedFiles=8,
-            totalChunks=40,
-            processingTime=4.1,
-            errors=["Error processing file1.md", "Error processing file2.md"],
+            processedFiles=10,
+            totalChunks=50,
+            processingTime=5.23,
+            errors=[],
         )
-        mock_sync.return_value = mock_result
-
-        response = client.post("/api/sync/bulk", json={"force": False})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["data"]["success"] is False
-        assert len(data["data"]["errors"]) == 2
-
-    @patch("app.services.sync_service.SyncService.execute_bulk_sync")
-    def test_execute_bulk_sync_error(self, mock_sync: Mock, client: TestClient) -> None:
-        """Test bulk sync error handling."""
-        mock_sync.side_effect = Exception("Sync service error")
 
-        response = client.post("/api/sync/bulk", json={"force": False})
-
-        assert response.status_code == 500
-        assert "一括同期エラー" in response.json()["detail"]
-
-    @patch("app.services.sync_service.SyncService.get_sync_status")
-    def test_get_sync_status_running(
-        self, mock_get_status: Mock, client: TestClient
-    ) -> None:
-        """Test sync status when sync is running."""
-        mock_status = SyncStatus(
-            isRunning=True, current=5, total=10, currentFile="/docs/file5.md"
+        response = test_client.post(
+            "/api/sync/bulk", content=FORCE_SYNC_BODY, headers=JSON_HEADERS
         )
-        mock_get_status.return_value = mock_status
-
-        response = client.get("/api/sync/status")
 
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
-        assert data["data"]["isRunning"] is True
-        assert data["data"]["current"] == 5
-        assert data["data"]["total"] == 10
-        assert data["data"]["currentFile"] == "/docs/file5.md"
-
-    @patch("app.services.sync_service.SyncService.get_sync_status")
-    def test_get_sync_status_idle(
-        self, mock_get_status: Mock, client: TestClient
-    ) -> None:
-        """Test sync status when sync is idle."""
-        mock_status = SyncStatus(isRunning=False, current=0, total=0, currentFile="")
-        mock_get_status.return_value = mock_status
-
-        response = client.get("/api/sync/status")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["data"]["isRunning"] is False
-
-    @patch("app.services.sync_service.SyncService.get_sync_status")
-    def test_get_sync_status_error(
-        self, mock_get_status: Mock, client: TestClient
+        assert data["data"]["totalFiles"] == 10
+        assert data["data"]["processedFiles"] == 10
+        assert len(data["data"]["errors"]) == 0
+        sync_service_stub.execute_bulk_sync.assert_called_once_with(force=True)
+
+    @pytest.mark.parametrize(
+        "mock_status",
+        [
+            pytest.param(
+                SyncStatus(
+                    isRunning=True, current=5, total=10, currentFile="/docs/file5.md"
+                ),
+                id="running",
+            ),
+            pytest.param(
+                SyncStatus(isRunning=False, current=0, total=0, currentFile=""),
+                id="idle",
+            ),
+        ],
+    )
+    async def test_get_sync_status(
+        self, sync_service_stub: MagicMock, mock_status: SyncStatus
     ) -> None:
-        """Test sync status error handling."""
-        mock_get_status.side_effect = Exception("Status service error")
+        """Test sync status retrieval."""
+        sync_service_stub.get_sync_status.return_value = mock_status
 
-        response = client.get("/api/sync/status")
+        response = await get_sync_status()
 
-        assert response.status_code == 500
-        assert "同期状態取得エラー" in response.json()["detail"]
+        assert response.success is True
+        assert response.data == mock_status
@@ -1,9 +1,9 @@
 """Tests for configuration system with git repository integration."""
 
-import os
-import tempfile
+from collections.abc import Generator
 from pathlib import Path
-from unittest.mock import Mock, patch
+from typing import Any
+from unittest.mock import Mock
 
 import pytest
 import yaml
@@ -18,10 +18,97 @@ from app.core.config import (
     ServerConfig,
     Settings,
     VectorDbConfig,
+    YamlLoader,
     find_git_root,
     load_config_file,
+    load_config_from_string,
 )
 
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _write_config_dir(
+    tmp_path_factory: pytest.TempPathFactory, name: str, content: str
+) -> Path:
+    """Create a temp directory holding a specmgr.config.yaml with given content."""
+    config_dir = tmp_path_factory.mktemp(name)
+    (config_dir / "specmgr.config.yaml").write_text(content)
+    return config_dir
+
+
+def _write_yaml_config_dir(
+    tmp_path_factory: pytest.TempPathFactory, name: str, config: dict[str, Any]
+) -> Path:
+    """Create a temp directory holding config serialized as YAML."""
+    return _write_config_dir(
+        tmp_path_factory, name, yaml.dump(config, Dumper=YamlDumper)
+    )
+
+
+BASIC_CONFIG = {"documents": {"path": "test-docs"}, "server": {"port": 8080}}
+
+OVERRIDE_CONFIG = {
+    "server": {"host": "192.168.1.100", "port": 9000},
+    "vector_db": {"collection": "test-collection"},
+    "logging": {"level": "debug"},
+}
+
+FULL_CONFIG = {
+    "documents": {
+        "path": "project-docs",
+        "extensions": [".md", ".rst"],
+        "exclude": ["build", "__pycache__"],
+    },
+    "server": {"host": "localhost", "port": 5000},
+    "search": {"max_results": 25, "chunk_size": 1500},
+    "vector_db": {"collection": "project-vectors", "vector_size": 768},
+    "queue": {"concurrency": 3, "max_retries": 3},
+}
+
+INVALID_CONFIG = {
+    "server": {
+        "port": "invalid-port"  # Should be int
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def basic_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Config directory with documents path and server port overrides."""
+    return _write_yaml_config_dir(tmp_path_factory, "basic_cfg", BASIC_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def override_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Config directory overriding server, vector DB and logging settings."""
+    return _write_yaml_config_dir(tmp_path_factory, "override_cfg", OVERRIDE_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def full_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Config directory exercising every configuration section."""
+    return _write_yaml_config_dir(tmp_path_factory, "full_cfg", FULL_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def invalid_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Config directory with invalid data types."""
+    return _write_yaml_config_dir(tmp_path_factory, "invalid_cfg", INVALID_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def no_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory without any config file."""
+    return tmp_path_factory.mktemp("no_cfg")
+
+
+@pytest.fixture(scope="module")
+def invalid_yaml_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Config directory with malformed YAML."""
+    return _write_config_dir(
+        tmp_path_factory, "invalid_yaml_cfg", "invalid: yaml: content: ["
+    )
+
 
 class TestGitRootDetection:
     """Test git repository root detection."""
@@ -33,20 +120,22 @@ class TestGitRootDetection:
         assert git_root.exists()
         assert (git_root / ".git").exists()
 
-    @patch("subprocess.run")
-    def test_find_git_root_command_failure_fallback(self, mock_run: Mock) -> None:
+    def test_find_git_root_command_failure_fallback(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test fallback when git command fails."""
         # Mock git command failure
-        mock_run.side_effect = FileNotFoundError()
+        monkeypatch.setattr("subprocess.run", Mock(side_effect=FileNotFoundError()))
 
         # The fallback logic should still return a Path object
         git_root = find_git_root()
         assert isinstance(git_root, Path)
 
-    @patch("subprocess.run")
-    def test_find_git_root_no_git_ultimate_fallback(self, mock_run: Mock) -> None:
+    def test_find_git_root_no_git_ultimate_fallback(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test ultimate fallback when no git repo found."""
-        mock_run.side_effect = FileNotFoundError()
+        monkeypatch.setattr("subprocess.run", Mock(side_effect=FileNotFoundError()))
 
         # Should return the calculated parent path
         git_root = find_git_root()
@@ -56,61 +145,49 @@ class TestGitRootDetection:
 class TestConfigFileLoading:
     """Test YAML configuration file loading."""
 
-    def test_load_config_file_exists(self) -> None:
+    def test_load_config_file_exists(self, basic_config_dir: Path) -> None:
         """Test loading existing config file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            config_file = temp_path / "specmgr.config.yaml"
-
-            # Create test config
-            test_config = {"documents": {"path": "test-docs"}, "server": {"port": 8080}}
-
-            with open(config_file, "w") as f:
-                yaml.dump(test_config, f)
-
-            # Load config
-            result = load_config_file(temp_path)
+        result = load_config_file(basic_config_dir)
 
-            assert result == test_config
-            assert result["documents"]["path"] == "test-docs"
-            assert result["server"]["port"] == 8080
+        assert result == BASIC_CONFIG
+        assert result["documents"]["path"] == "test-docs"
+        assert result["server"]["port"] == 8080
 
-    def test_load_config_file_not_exists(self) -> None:
+    def test_load_config_file_not_exists(self, no_config_dir: Path) -> None:
         """Test behavior when config file doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        result = load_config_file(no_config_dir)
 
-            result = load_config_file(temp_path)
+        assert result == {}
 
-            assert result == {}
-
-    def test_load_config_file_invalid_yaml(self) -> None:
+    def test_load_config_file_invalid_yaml(self, invalid_yaml_config_dir: Path) -> None:
         """Test handling of invalid YAML."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            config_file = temp_path / "specmgr.config.yaml"
-
-            # Create invalid YAML
-            with open(config_file, "w") as f:
-                f.write("invalid: yaml: content: [")
+        # Should return empty dict and not crash
+        result = load_config_file(invalid_yaml_config_dir)
 
-            # Should return empty dict and not crash
-            result = load_config_file(temp_path)
+        assert result == {}
 
-            assert result == {}
+    def test_yaml_loader_uses_libyaml(self) -> None:
+        """Test that the C loader is selected when libyaml is available."""
+        if yaml.__with_libyaml__:
+            assert YamlLoader is yaml.CSafeLoader
+        else:
+            assert YamlLoader is yaml.SafeLoader
 
-    def test_load_config_file_empty_file(self) -> None:
-        """Test handling of empty YAML file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            config_file = temp_path / "specmgr.config.yaml"
+    def test_load_config_from_string(self) -> None:
+        """Test parsing config from YAML text without touching disk."""
+        result = load_config_from_string(yaml.dump(FULL_CONFIG, Dumper=YamlDumper))
 
-            # Create empty file
-            config_file.touch()
+        assert result == FULL_CONFIG
 
-            result = load_config_file(temp_path)
+    @pytest.mark.parametrize("text", ["", "# comments only\n"])
+    def test_load_config_from_string_empty(self, text: str) -> None:
+        """Test that empty YAML text yields an empty config."""
+        assert load_config_from_string(text) == {}
 
-            assert result == {}
+    def test_load_config_from_string_invalid_yaml(self) -> None:
+        """Test that invalid YAML text raises instead of being swallowed."""
+        with pytest.raises(yaml.YAMLError):
+            load_config_from_string("invalid: yaml: content: [")
 
 
 class TestAppConfig:
@@ -176,174 +253,140 @@ class TestAppConfig:
         assert app_config.server.port == 3000  # Default
 
 
-class TestSettings:
-    """Test Settings class with git integration."""
+@pytest.fixture(scope="class")
+def cached_git_root() -> Generator[Path, None, None]:
+    """Resolve the git root once and reuse it for every Settings() in the class."""
+    git_root = find_git_root()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.core.config.find_git_root", lambda: git_root)
+        yield git_root
 
-    def test_settings_basic_initialization(self) -> None:
-        """Test basic settings initialization."""
-        settings = Settings()
 
-        assert isinstance(settings.git_root, Path)
-        assert isinstance(settings.app_config, AppConfig)
-        assert settings.documents_path
-        assert settings.watch_directory
+@pytest.fixture(scope="class")
+def default_settings(cached_git_root: Path) -> Settings:
+    """Settings built once from the repository's own git root."""
+    return Settings()
 
-    def test_settings_documents_path_computation(self) -> None:
-        """Test documents path computation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
 
-            # Create mock git root and config
-            config_file = temp_path / "specmgr.config.yaml"
-            config_data = {"documents": {"path": "test-docs"}}
+def _settings_for(config_dir: Path) -> Settings:
+    """Build Settings with git root detection pointed at config_dir."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.core.config.find_git_root", lambda: config_dir)
+        return Settings()
 
-            with open(config_file, "w") as f:
-                yaml.dump(config_data, f)
 
-            # Mock git root detection
-            with patch("app.core.config.find_git_root", return_value=temp_path):
-                settings = Settings()
+@pytest.fixture(scope="module")
+def basic_settings(basic_config_dir: Path) -> Settings:
+    """Settings loaded from the basic config scenario."""
+    return _settings_for(basic_config_dir)
 
-                expected_path = str(temp_path / "test-docs")
-                assert settings.documents_path == expected_path
-                assert settings.watch_directory == "test-docs"
 
-    def test_settings_environment_variable_override(self) -> None:
-        """Test environment variable override."""
-        test_api_key = "test-api-key-12345"
+@pytest.fixture(scope="module")
+def override_settings(override_config_dir: Path) -> Settings:
+    """Settings loaded from the override config scenario."""
+    return _settings_for(override_config_dir)
 
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": test_api_key}):
-            settings = Settings()
-            assert settings.anthropic_api_key == test_api_key
 
-    def test_settings_config_file_override(self) -> None:
-        """Test configuration file override of settings."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create config with overrides
-            config_file = temp_path / "specmgr.config.yaml"
-            config_data = {
-                "server": {"host": "192.168.1.100", "port": 9000},
-                "vector_db": {"collection": "test-collection"},
-                "logging": {"level": "debug"},
-            }
+@pytest.mark.usefixtures("cached_git_root")
+class TestSettings:
+    """Test Settings class with git integration."""
 
-            with open(config_file, "w") as f:
-                yaml.dump(config_data, f)
+    def test_settings_basic_initialization(self, default_settings: Settings) -> None:
+        """Test basic settings initialization."""
+        assert isinstance(default_settings.git_root, Path)
+        assert isinstance(default_settings.app_config, AppConfig)
+        assert default_settings.documents_path
+        assert default_settings.watch_directory
+
+    def test_settings_documents_path_computation(
+        self, basic_settings: Settings, basic_config_dir: Path
+    ) -> None:
+        """Test documents path computation."""
+        expected_path = str(basic_config_dir / "test-docs")
+        assert basic_settings.documents_path == expected_path
+        assert basic_settings.watch_directory == "test-docs"
 
-            # Mock git root detection
-            with patch("app.core.config.find_git_root", return_value=temp_path):
-                settings = Settings()
+    def test_settings_environment_variable_override(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test environment variable override."""
+        test_api_key = "test-api-key-12345"
+        monkeypatch.setenv("ANTHROPIC_API_KEY", test_api_key)
 
-                # Test that app_config contains the expected values
-                assert settings.app_config.server.host == "192.168.1.100"
-                assert settings.app_config.server.port == 9000
-                assert settings.app_config.vector_db.collection == "test-collection"
-                assert settings.app_config.logging.level == "debug"
+        settings = Settings()
+        assert settings.anthropic_api_key == test_api_key
 
-    def test_settings_priority_env_over_config(self) -> None:
+    def test_settings_config_file_override(self, override_settings: Settings) -> None:
+        """Test configuration file override of settings."""
+        # Test that app_config contains the expected values
+        assert override_settings.app_config.server.host == "192.168.1.100"
+        assert override_settings.app_config.server.port == 9000
+        assert override_settings.app_config.vector_db.collection == "test-collection"
+        assert override_settings.app_config.logging.level == "debug"
+
+    def test_settings_priority_env_over_config(
+        self, monkeypatch: pytest.MonkeyPatch, override_config_dir: Path
+    ) -> None:
         """Test that environment variables take priority over config file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create config file
-            config_file = temp_path / "specmgr.config.yaml"
-            config_data = {"logging": {"level": "debug"}}
-
-            with open(config_file, "w") as f:
-                yaml.dump(config_data, f)
+        # Set environment variable
+        monkeypatch.setenv("LOG_LEVEL", "error")
+        monkeypatch.setattr(
+            "app.core.config.find_git_root", lambda: override_config_dir
+        )
 
-            # Set environment variable
-            with patch.dict(os.environ, {"LOG_LEVEL": "error"}):
-                with patch("app.core.config.find_git_root", return_value=temp_path):
-                    settings = Settings()
+        settings = Settings()
 
-                    # Environment variable should take priority
-                    assert settings.log_level == "error"
+        # Environment variable should take priority
+        assert settings.log_level == "error"
 
-    def test_settings_git_root_absolute_path(self) -> None:
+    def test_settings_git_root_absolute_path(self, default_settings: Settings) -> None:
         """Test that git_root is always absolute path."""
-        settings = Settings()
-
-        assert settings.git_root.is_absolute()
-        assert settings.documents_path  # Should be non-empty
-        assert Path(settings.documents_path).is_absolute()
+        assert default_settings.git_root.is_absolute()
+        assert default_settings.documents_path  # Should be non-empty
+        assert Path(default_settings.documents_path).is_absolute()
 
 
 class TestIntegration:
     """Integration tests for the complete configuration system."""
 
-    def test_full_config_integration(self) -> None:
+    def test_full_config_integration(
+        self, monkeypatch: pytest.MonkeyPatch, full_config_dir: Path
+    ) -> None:
         """Test complete configuration system integration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create comprehensive config
-            config_file = temp_path / "specmgr.config.yaml"
-            config_data = {
-                "documents": {
-                    "path": "project-docs",
-                    "extensions": [".md", ".rst"],
-                    "exclude": ["build", "__pycache__"],
-                },
-                "server": {"host": "localhost", "port": 5000},
-                "search": {"max_results": 25, "chunk_size": 1500},
-                "vector_db": {"collection": "project-vectors", "vector_size": 768},
-                "queue": {"concurrency": 3, "max_retries": 3},
-            }
+        # Set some environment variables
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "env-api-key")
+        monkeypatch.setenv("REDIS_URL", "redis://env-redis:6379")
+        monkeypatch.setattr("app.core.config.find_git_root", lambda: full_config_dir)
 
-            with open(config_file, "w") as f:
-                yaml.dump(config_data, f)
-
-            # Set some environment variables
-            env_vars = {
-                "ANTHROPIC_API_KEY": "env-api-key",
-                "REDIS_URL": "redis://env-redis:6379",
-            }
+        settings = Settings()
 
-            with patch.dict(os.environ, env_vars):
-                with patch("app.core.config.find_git_root", return_value=temp_path):
-                    settings = Settings()
-
-                    # Test git root and path computation
-                    assert settings.git_root == temp_path
-                    assert settings.documents_path == str(temp_path / "project-docs")
-                    assert settings.watch_directory == "project-docs"
-
-                    # Test environment variables
-                    assert settings.anthropic_api_key == "env-api-key"
-                    assert settings.redis_url == "redis://env-redis:6379"
-
-                    # Test config overrides through app_config
-                    assert settings.app_config.server.host == "localhost"
-                    assert settings.app_config.server.port == 5000
-                    assert settings.app_config.vector_db.collection == "project-vectors"
-
-                    # Test app config
-                    assert settings.app_config.documents.path == "project-docs"
-                    assert settings.app_config.documents.extensions == [".md", ".rst"]
-                    assert settings.app_config.search.max_results == 25
-                    assert settings.app_config.search.chunk_size == 1500
-                    assert settings.app_config.vector_db.vector_size == 768
-                    assert settings.app_config.queue.concurrency == 3
-
-    def test_config_validation_errors(self) -> None:
+        # Test git root and path computation
+        assert settings.git_root == full_config_dir
+        assert settings.documents_path == str(full_config_dir / "project-docs")
+        assert settings.watch_directory == "project-docs"
+
+        # Test environment variables
+        assert settings.anthropic_api_key == "env-api-key"
+        assert settings.redis_url == "redis://env-redis:6379"
+
+        # Test config overrides through app_config
+        assert settings.app_config.server.host == "localhost"
+        assert settings.app_config.server.port == 5000
+        assert settings.app_config.vector_db.collection == "project-vectors"
+
+        # Test app config
+        assert settings.app_config.documents.path == "project-docs"
+        assert settings.app_config.documents.extensions == [".md", ".rst"]
+        assert settings.app_config.search.max_results == 25
+        assert settings.app_config.search.chunk_size == 1500
+        assert settings.app_config.vector_db.vector_size == 768
+        assert settings.app_config.queue.concurrency == 3
+
+    def test_config_validation_errors(
+        self, monkeypatch: pytest.MonkeyPatch, invalid_config_dir: Path
+    ) -> None:
         """Test configuration validation and error handling."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create config with invalid data types
-            config_file = temp_path / "specmgr.config.yaml"
-            config_data = {
-                "server": {
-                    "port": "invalid-port"  # Should be int
-                }
-            }
-
-            with open(config_file, "w") as f:
-                yaml.dump(config_data, f)
+        monkeypatch.setattr("app.core.config.find_git_root", lambda: invalid_config_dir)
 
-            with patch("app.core.config.find_git_root", return_value=temp_path):
-                with pytest.raises(ValueError):  # Should raise validation error
-                    Settings()
+        with pytest.raises(ValueError):  # Should raise validation error
+            Settings()
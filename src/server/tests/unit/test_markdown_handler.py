@@ -1,47 +1,68 @@
 """Tests for MarkdownFileHandler."""
 
-import tempfile
+import os
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
 import pytest
-from watchdog.events import FileCreatedEvent, FileDeletedEvent, FileModifiedEvent
+from watchdog.events import (
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileSystemEvent,
+)
 
 from app.services.file_watcher import MarkdownFileHandler
 
+EVENT_CLASSES: dict[str, type[FileSystemEvent]] = {
+    "created": FileCreatedEvent,
+    "modified": FileModifiedEvent,
+    "deleted": FileDeletedEvent,
+}
 
-class TestMarkdownFileHandler:
-    """Test MarkdownFileHandler functionality."""
 
-    @pytest.fixture
-    def mock_queue_service(self) -> Mock:
-        """Mock queue service."""
-        mock_service = Mock()
-        mock_service.add_sync_job = AsyncMock()
-        return mock_service
+def _make_event(kind: str, path: Path) -> FileSystemEvent:
+    """Build a watchdog file event of the given kind for path."""
+    return EVENT_CLASSES[kind](os.fspath(path))
 
-    @pytest.fixture
-    def temp_docs_directory(self) -> Path:  # type: ignore[misc]
-        """Create temporary docs directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            docs_dir = Path(tmpdir)
-            yield docs_dir
 
-    @pytest.fixture
-    def markdown_handler(
-        self, mock_queue_service: Mock, temp_docs_directory: Path
-    ) -> MarkdownFileHandler:
-        """Create MarkdownFileHandler with mocked dependencies."""
-        handler = MarkdownFileHandler(mock_queue_service)
-        # Note: docs_root not used in constructor, handler operates on any path
-        return handler
+@pytest.fixture(scope="session")
+def temp_docs_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one temporary docs root shared by every handler test."""
+    return tmp_path_factory.mktemp("md_handler_tests")
+
+
+@pytest.fixture(scope="module")
+def mock_queue_service() -> Mock:
+    """Mock queue service shared across the module."""
+    mock_service = Mock()
+    mock_service.add_sync_job = AsyncMock()
+    return mock_service
+
+
+@pytest.fixture(scope="module")
+def markdown_handler(mock_queue_service: Mock) -> MarkdownFileHandler:
+    """Create MarkdownFileHandler with mocked dependencies."""
+    # Note: docs_root not used in constructor, handler operates on any path
+    return MarkdownFileHandler(mock_queue_service)
+
+
+@pytest.fixture(autouse=True)
+def reset_markdown_handler(
+    mock_queue_service: Mock, markdown_handler: MarkdownFileHandler
+) -> None:
+    """Clear call history and handler state left by the previous test."""
+    mock_queue_service.reset_mock()
+    markdown_handler.processed_files.clear()
+
+
+class TestMarkdownFileHandler:
+    """Test MarkdownFileHandler functionality."""
 
     @pytest.fixture
-    def sample_markdown_file(self, temp_docs_directory: Path) -> Path:
-        """Create sample markdown file."""
-        test_file = temp_docs_directory / "test.md"
-        test_file.write_text("# Test Markdown\n\nThis is a test file.")
-        return test_file
+    def sample_markdown_file(self, temp_docs_root: Path) -> Path:
+        """Sample markdown path (handlers only inspect the extension)."""
+        return temp_docs_root / "test.md"
 
     def test_init(self, markdown_handler: MarkdownFileHandler) -> None:
         """Test markdown handler initialization."""
@@ -49,21 +70,22 @@ class TestMarkdownFileHandler:
         assert hasattr(markdown_handler, "queue_service")
         assert hasattr(markdown_handler, "processed_files")
 
-    def test_is_markdown_file_valid(
-        self, markdown_handler: MarkdownFileHandler
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("test.md", True),
+            ("test.markdown", True),
+            ("README.md", True),
+            ("test.txt", False),
+            ("test.py", False),
+            ("test", False),
+        ],
+    )
+    def test_is_markdown_file(
+        self, markdown_handler: MarkdownFileHandler, name: str, expected: bool
     ) -> None:
         """Test markdown file detection."""
-        assert markdown_handler._is_markdown_file("test.md") is True
-        assert markdown_handler._is_markdown_file("test.markdown") is True
-        assert markdown_handler._is_markdown_file("README.md") is True
-
-    def test_is_markdown_file_invalid(
-        self, markdown_handler: MarkdownFileHandler
-    ) -> None:
-        """Test non-markdown file detection."""
-        assert markdown_handler._is_markdown_file("test.txt") is False
-        assert markdown_handler._is_markdown_file("test.py") is False
-        assert markdown_handler._is_markdown_file("test") is False
+        assert markdown_handler._is_markdown_file(name) is expected
 
     # Note: _should_ignore method not implemented in current handler
     # File filtering done at file type level (_is_markdown_file)
@@ -78,7 +100,7 @@ class TestMarkdownFileHandler:
         mock_queue_service: Mock,
     ) -> None:
         """Test file creation event handling for markdown files."""
-        event = FileCreatedEvent(str(sample_markdown_file))
+        event = _make_event("created", sample_markdown_file)
 
         # on_created is sync method that creates async task
         markdown_handler.on_created(event)
@@ -89,13 +111,12 @@ class TestMarkdownFileHandler:
     def test_on_created_non_markdown_file(
         self,
         markdown_handler: MarkdownFileHandler,
-        temp_docs_directory: Path,
+        temp_docs_root: Path,
         mock_queue_service: Mock,
     ) -> None:
         """Test file creation event handling for non-markdown files."""
-        text_file = temp_docs_directory / "test.txt"
-        text_file.write_text("This is not markdown")
-        event = FileCreatedEvent(str(text_file))
+        text_file = temp_docs_root / "test.txt"
+        event = _make_event("created", text_file)
 
         # Should ignore non-markdown files
         markdown_handler.on_created(event)
@@ -110,7 +131,7 @@ class TestMarkdownFileHandler:
         mock_queue_service: Mock,
     ) -> None:
         """Test file modification event handling for markdown files."""
-        event = FileModifiedEvent(str(sample_markdown_file))
+        event = _make_event("modified", sample_markdown_file)
 
         # Should handle markdown file modifications
         markdown_handler.on_modified(event)
@@ -118,12 +139,11 @@ class TestMarkdownFileHandler:
     def test_on_modified_non_markdown_file(
         self,
         markdown_handler: MarkdownFileHandler,
-        temp_docs_directory: Path,
+        temp_docs_root: Path,
     ) -> None:
         """Test file modification event handling for non-markdown files."""
-        text_file = temp_docs_directory / "test.txt"
-        text_file.write_text("Modified content")
-        event = FileModifiedEvent(str(text_file))
+        text_file = temp_docs_root / "test.txt"
+        event = _make_event("modified", text_file)
 
         # Should ignore non-markdown files
         markdown_handler.on_modified(event)
@@ -133,11 +153,11 @@ class TestMarkdownFileHandler:
     def test_on_deleted_markdown_file(
         self,
         markdown_handler: MarkdownFileHandler,
-        temp_docs_directory: Path,
+        temp_docs_root: Path,
     ) -> None:
         """Test file deletion event handling for markdown files."""
-        deleted_file = temp_docs_directory / "deleted.md"
-        event = FileDeletedEvent(str(deleted_file))
+        deleted_file = temp_docs_root / "deleted.md"
+        event = _make_event("deleted", deleted_file)
 
         # Should handle markdown file deletions
         markdown_handler.on_deleted(event)
@@ -145,11 +165,11 @@ class TestMarkdownFileHandler:
     def test_on_deleted_non_markdown_file(
         self,
         markdown_handler: MarkdownFileHandler,
-        temp_docs_directory: Path,
+        temp_docs_root: Path,
     ) -> None:
         """Test file deletion event handling for non-markdown files."""
-        deleted_file = temp_docs_directory / "deleted.txt"
-        event = FileDeletedEvent(str(deleted_file))
+        deleted_file = temp_docs_root / "deleted.txt"
+        event = _make_event("deleted", deleted_file)
 
         # Should ignore non-markdown files
         markdown_handler.on_deleted(event)
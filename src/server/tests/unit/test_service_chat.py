@@ -1,5 +1,7 @@
 """Tests for ChatService."""
 
+from contextlib import aclosing
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -8,38 +10,54 @@ from app.models.api_models import ChatMessage
 from app.services.chat_service import ChatService
 
 
-class TestChatService:
-    """Test ChatService functionality."""
+def _result(content: str, file_name: str) -> SimpleNamespace:
+    """Build a search result stub with the attributes ChatService reads."""
+    return SimpleNamespace(
+        content=content, metadata=SimpleNamespace(file_name=file_name)
+    )
 
-    @pytest.fixture
-    def mock_search_service(self) -> Mock:
-        """Mock search service."""
-        mock_service = Mock()
-        mock_service.search = AsyncMock(
-            return_value={
-                "results": [
-                    {
-                        "id": "1",
-                        "content": "Test search result",
-                        "score": 0.95,
-                        "metadata": {"filePath": "/test.md", "fileName": "test.md"},
-                    }
-                ],
-                "totalResults": 1,
-                "processingTime": 0.05,
-            }
-        )
-        return mock_service
 
-    @pytest.fixture
-    def chat_service(self, mock_search_service: Mock) -> ChatService:
-        """Create ChatService with mocked dependencies."""
-        with patch(
-            "app.services.chat_service.SearchService", return_value=mock_search_service
-        ):
-            service = ChatService()
-            service.search_service = mock_search_service
-            return service
+def _results(*results: SimpleNamespace) -> SimpleNamespace:
+    """Build a search response stub wrapping the given results."""
+    return SimpleNamespace(results=list(results))
+
+
+SEARCH_RESPONSE = _results(_result("Test search result", "test.md"))
+EMPTY_RESULTS = _results()
+
+
+@pytest.fixture(scope="module")
+def mock_search_service() -> Mock:
+    """Mock search service shared across the module."""
+    mock_service = Mock()
+    mock_service.search = AsyncMock(return_value=SEARCH_RESPONSE)
+    return mock_service
+
+
+@pytest.fixture(scope="module")
+def chat_service(mock_search_service: Mock) -> ChatService:
+    """Create ChatService with mocked dependencies."""
+    with patch(
+        "app.services.chat_service.SearchService", return_value=mock_search_service
+    ):
+        return ChatService()
+
+
+@pytest.fixture(autouse=True)
+def reset_search_service(mock_search_service: Mock) -> None:
+    """Restore the shared search mock's default behaviour before each test."""
+    mock_search_service.search.reset_mock(return_value=True, side_effect=True)
+    mock_search_service.search.return_value = SEARCH_RESPONSE
+
+
+@pytest.fixture
+def failing_search(mock_search_service: Mock) -> None:
+    """Make the shared search mock raise; reset_search_service restores it."""
+    mock_search_service.search.side_effect = Exception("Search service error")
+
+
+class TestChatService:
+    """Test ChatService functionality."""
 
     @pytest.fixture
     def sample_chat_message(self) -> ChatMessage:
@@ -59,7 +77,6 @@ class TestChatService:
     # Individual service health checks are not needed as HealthService provides
     # centralized health monitoring for all components
 
-    @pytest.mark.asyncio
     async def test_get_rag_context(
         self, chat_service: ChatService, mock_search_service: Mock
     ) -> None:
@@ -73,46 +90,25 @@ class TestChatService:
         )
         assert "Test search result" in context
 
-    @pytest.mark.asyncio
     async def test_get_rag_context_no_results(
         self, chat_service: ChatService, mock_search_service: Mock
     ) -> None:
         """Test RAG context retrieval when no search results."""
         # Mock search service to return no results
-        mock_search_service.search.return_value = type(
-            "SearchResults", (), {"results": []}
-        )()
+        mock_search_service.search.return_value = EMPTY_RESULTS
 
         context = await chat_service._get_rag_context("empty query")
 
         assert context == ""
 
-    @pytest.mark.asyncio
     async def test_build_rag_context_multiple_results(
         self, chat_service: ChatService, mock_search_service: Mock
     ) -> None:
         """Test RAG context building with multiple search results."""
-        # Mock search results with proper structure
-        mock_result_1 = type(
-            "SearchResult",
-            (),
-            {
-                "content": "First relevant document content",
-                "metadata": type("Metadata", (), {"file_name": "first.md"})(),
-            },
-        )()
-        mock_result_2 = type(
-            "SearchResult",
-            (),
-            {
-                "content": "Second relevant document content",
-                "metadata": type("Metadata", (), {"file_name": "second.md"})(),
-            },
-        )()
-
-        mock_search_service.search.return_value = type(
-            "SearchResults", (), {"results": [mock_result_1, mock_result_2]}
-        )()
+        mock_search_service.search.return_value = _results(
+            _result("First relevant document content", "first.md"),
+            _result("Second relevant document content", "second.md"),
+        )
 
         context = await chat_service._get_rag_context("test query")
 
@@ -121,26 +117,21 @@ class TestChatService:
         assert "first.md" in context
         assert "second.md" in context
 
-    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("failing_search")
     async def test_build_rag_context_search_error(
-        self, chat_service: ChatService, mock_search_service: Mock
+        self, chat_service: ChatService
     ) -> None:
         """Test RAG context building when search fails."""
-        mock_search_service.search.side_effect = Exception("Search service error")
-
         # Should return empty string on error, not raise exception
         context = await chat_service._get_rag_context("test query")
         assert context == ""
 
-    @pytest.mark.asyncio
     async def test_build_rag_context_default_limit(
         self, chat_service: ChatService, mock_search_service: Mock
     ) -> None:
         """Test RAG context building with default limit."""
         query = "complex query"
-        mock_search_service.search.return_value = type(
-            "SearchResults", (), {"results": []}
-        )()
+        mock_search_service.search.return_value = EMPTY_RESULTS
 
         await chat_service._get_rag_context(query)
 
@@ -151,26 +142,22 @@ class TestChatService:
     # Note: _extract_keywords method not implemented in current ChatService
     # Keyword extraction functionality may be added in future iterations
 
-    @pytest.mark.asyncio
     async def test_chat_stream_success(
         self, chat_service: ChatService, sample_chat_message: ChatMessage
     ) -> None:
         """Test successful chat streaming."""
-        # Test the actual chat_stream method
-        response_chunks = []
-        async for chunk in chat_service.chat_stream(
+        # Test the actual chat_stream method; the first chunk is enough
+        stream = chat_service.chat_stream(
             message=sample_chat_message.content,
             conversation_history=[sample_chat_message],
             use_rag=False,
-        ):
-            response_chunks.append(chunk)
+        )
+        async with aclosing(stream):
+            first_chunk = await anext(stream)
 
-        # Should receive some response chunks
-        assert len(response_chunks) > 0
-        full_response = "".join(response_chunks)
-        assert len(full_response) > 0
+        # Should receive a non-empty response chunk
+        assert first_chunk
 
-    @pytest.mark.asyncio
     async def test_chat_stream_with_rag_context(
         self,
         chat_service: ChatService,
@@ -178,48 +165,39 @@ class TestChatService:
         mock_search_service: Mock,
     ) -> None:
         """Test chat streaming with RAG context."""
-        # Mock search context with proper structure
-        mock_result = type(
-            "SearchResult",
-            (),
-            {
-                "content": "Context information",
-                "metadata": type("Metadata", (), {"file_name": "context.md"})(),
-            },
-        )()
-        mock_search_service.search.return_value = type(
-            "SearchResults", (), {"results": [mock_result]}
-        )()
-
-        response_chunks = []
-        async for chunk in chat_service.chat_stream(
+        mock_search_service.search.return_value = _results(
+            _result("Context information", "context.md")
+        )
+
+        stream = chat_service.chat_stream(
             message=sample_chat_message.content,
             conversation_history=[sample_chat_message],
             use_rag=True,
-        ):
-            response_chunks.append(chunk)
+        )
+        async with aclosing(stream):
+            first_chunk = await anext(stream)
 
+        # RAG context is fetched before the first chunk is yielded
         mock_search_service.search.assert_called()
-        assert len(response_chunks) > 0
+        assert first_chunk
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
+    @pytest.mark.usefixtures("failing_search")
     async def test_chat_stream_error_handling(
         self, chat_service: ChatService, sample_chat_message: ChatMessage
     ) -> None:
         """Test chat streaming error handling."""
         # Test with search service error
-        with patch.object(
-            chat_service.search_service, "search", side_effect=Exception("Search error")
+        found_error = False
+        async for chunk in chat_service.chat_stream(
+            message=sample_chat_message.content, use_rag=True
         ):
-            response_chunks = []
-            async for chunk in chat_service.chat_stream(
-                message=sample_chat_message.content, use_rag=True
-            ):
-                response_chunks.append(chunk)
-
-            # Should handle error gracefully and provide error message
-            full_response = "".join(response_chunks)
-            assert "error" in full_response.lower()
+            if "error" in chunk.lower():
+                found_error = True
+                break
+
+        # Should handle error gracefully and provide error message
+        assert found_error
 
     # Note: _create_assistant_message method not implemented in current ChatService
     # Message creation handled by API layer
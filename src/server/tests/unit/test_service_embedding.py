@@ -1,43 +1,73 @@
 """Tests for EmbeddingService."""
 
-from collections.abc import Generator
+import math
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from app.services.embedding_service import EmbeddingService
 
+ZERO_VECTOR = [0.0] * 1536
+LONG_TEXT = "A" * 10000
+MEDIUM_TEXT = "A" * 1000
+SENTENCE_TEXT = "First sentence. Second sentence. Third sentence." + MEDIUM_TEXT
+CANONICAL_TEXTS = ("This is a test document.", "Document 1", "Document 2", "Document 3")
+
+
+@pytest.fixture(scope="module")
+def mock_anthropic_client(request: pytest.FixtureRequest) -> Mock:
+    """Mock Anthropic client, patched once for the whole module."""
+    anthropic_patcher = patch("app.services.embedding_service.Anthropic")
+    mock_anthropic_class = anthropic_patcher.start()
+    request.addfinalizer(anthropic_patcher.stop)
+    mock_client = Mock()
+    mock_anthropic_class.return_value = mock_client
+    return mock_client
+
+
+@pytest.fixture(scope="module")
+def embedding_service(mock_anthropic_client: Mock) -> EmbeddingService:
+    """Create EmbeddingService with mocked client."""
+    with patch("app.services.embedding_service.settings") as mock_settings:
+        mock_settings.anthropic_api_key = "test-api-key"
+        mock_settings.app_config.vector_db.vector_size = 1536
+        return EmbeddingService()
+
+
+@pytest.fixture(scope="module")
+def embedding_service_no_key() -> EmbeddingService:
+    """Create EmbeddingService without API key."""
+    with patch("app.services.embedding_service.settings") as mock_settings:
+        mock_settings.anthropic_api_key = ""
+        mock_settings.app_config.vector_db.vector_size = 1536
+        return EmbeddingService()
+
+
+@pytest.fixture(scope="module")
+async def canonical_embeddings(
+    embedding_service: EmbeddingService,
+) -> dict[str, list[float]]:
+    """Hash-based embeddings for the canonical test inputs, computed once."""
+    return {
+        text: await embedding_service.generate_embedding(text)
+        for text in CANONICAL_TEXTS
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_anthropic_client(mock_anthropic_client: Mock) -> None:
+    """Isolate call counts on the shared Anthropic client mock."""
+    mock_anthropic_client.reset_mock()
+
 
 class TestEmbeddingService:
     """Test EmbeddingService functionality."""
 
-    @pytest.fixture
-    def mock_anthropic_client(self) -> Generator[Mock, None, None]:
-        """Mock Anthropic client."""
-        with patch("app.services.embedding_service.Anthropic") as mock_anthropic_class:
-            mock_client = Mock()
-            mock_anthropic_class.return_value = mock_client
-            yield mock_client
-
-    @pytest.fixture
-    def embedding_service(self, mock_anthropic_client: Mock) -> EmbeddingService:
-        """Create EmbeddingService with mocked client."""
-        with patch("app.services.embedding_service.settings") as mock_settings:
-            mock_settings.anthropic_api_key = "test-api-key"
-            mock_settings.app_config.vector_db.vector_size = 1536
-            return EmbeddingService()
-
-    @pytest.fixture
-    def embedding_service_no_key(self) -> EmbeddingService:
-        """Create EmbeddingService without API key."""
-        with patch("app.services.embedding_service.settings") as mock_settings:
-            mock_settings.anthropic_api_key = ""
-            mock_settings.app_config.vector_db.vector_size = 1536
-            return EmbeddingService()
-
-    @pytest.mark.asyncio
     async def test_generate_embedding_success(
-        self, embedding_service: EmbeddingService, mock_anthropic_client: Mock
+        self,
+        embedding_service: EmbeddingService,
+        canonical_embeddings: dict[str, list[float]],
     ) -> None:
         """Test successful embedding generation."""
         text = "This is a test document."
@@ -45,20 +75,15 @@ class TestEmbeddingService:
         result = await embedding_service.generate_embedding(text)
 
         # Hash-based implementation should return deterministic vectors
-        assert len(result) == 1536  # Vector size
-        assert all(isinstance(val, float) for val in result)
+        assert np.asarray(result, dtype=float).shape == (1536,)  # Vector size
 
         # Test that same text produces same embedding (deterministic)
-        result2 = await embedding_service.generate_embedding(text)
-        assert result == result2
+        assert result == canonical_embeddings[text]
 
         # Test that vector is normalized (L2 norm should be approximately 1)
-        import numpy as np
-
-        norm = np.linalg.norm(result)
-        assert abs(norm - 1.0) < 1e-6
+        norm = np.linalg.norm(np.asarray(result, dtype=np.float32))
+        assert math.isclose(norm, 1.0, abs_tol=1e-6)
 
-    @pytest.mark.asyncio
     async def test_generate_embedding_no_api_key(
         self, embedding_service_no_key: EmbeddingService
     ) -> None:
@@ -68,40 +93,38 @@ class TestEmbeddingService:
         with pytest.raises(ValueError, match="Claude Code SDK API key not configured"):
             await embedding_service_no_key.generate_embedding(text)
 
-    @pytest.mark.asyncio
     async def test_generate_embeddings_batch_success(
-        self, embedding_service: EmbeddingService, mock_anthropic_client: Mock
+        self,
+        embedding_service: EmbeddingService,
+        canonical_embeddings: dict[str, list[float]],
     ) -> None:
         """Test batch embedding generation."""
         texts = ["Document 1", "Document 2", "Document 3"]
 
         results = await embedding_service.generate_embeddings_batch(texts)
 
-        assert len(results) == 3
         # Each result should be a valid embedding vector
-        for result in results:
-            assert len(result) == 1536
-            assert all(isinstance(val, float) for val in result)
+        arr = np.asarray(results, dtype=float)
+        assert arr.shape == (3, 1536)
+        assert results == [canonical_embeddings[text] for text in texts]
 
         # Different texts should produce different embeddings
-        assert results[0] != results[1]
-        assert results[1] != results[2]
+        assert not np.array_equal(arr[0], arr[1])
+        assert not np.array_equal(arr[1], arr[2])
 
-    @pytest.mark.asyncio
     async def test_generate_embeddings_batch_with_error(
-        self, embedding_service: EmbeddingService, mock_anthropic_client: Mock
+        self,
+        embedding_service: EmbeddingService,
+        canonical_embeddings: dict[str, list[float]],
     ) -> None:
         """Test batch embedding generation with some failures."""
         texts = ["Document 1", "Document 2"]
-        zero_vector = [0.0] * 1536
 
         # Patch the generate_embedding method to simulate error on second call
-        original_method = embedding_service.generate_embedding
-
         async def mock_generate_embedding(text: str) -> list[float]:
             if text == "Document 2":
                 raise Exception("Simulated error")
-            return await original_method(text)
+            return canonical_embeddings[text]
 
         # Patch the method using unittest.mock
         with patch.object(
@@ -111,10 +134,9 @@ class TestEmbeddingService:
 
         assert len(results) == 2
         # First should succeed with valid embedding
-        assert len(results[0]) == 1536
-        assert all(isinstance(val, float) for val in results[0])
+        assert results[0] == canonical_embeddings["Document 1"]
         # Second should fail and get zero vector
-        assert results[1] == zero_vector
+        assert results[1] == ZERO_VECTOR
 
     def test_truncate_text_short_text(
         self, embedding_service: EmbeddingService
@@ -127,34 +149,28 @@ class TestEmbeddingService:
 
         assert result == text
 
-    def test_truncate_text_long_text(self, embedding_service: EmbeddingService) -> None:
-        """Test text truncation with long text."""
-        text = "A" * 10000  # Very long text
-        max_tokens = 100  # Small limit
-
-        result = embedding_service._truncate_text(text, max_tokens)
-
-        # Should be truncated (max_tokens * 4 characters)
-        assert len(result) <= max_tokens * 4
-
-    def test_truncate_text_with_sentence_boundary(
-        self, embedding_service: EmbeddingService
+    @pytest.mark.parametrize(
+        ("text", "max_tokens"),
+        [
+            pytest.param(LONG_TEXT, 100, id="long_text"),
+            pytest.param(SENTENCE_TEXT, 100, id="sentence_boundary"),
+            # 1 token ≈ 4 characters, so 200 tokens allow 800 characters
+            pytest.param(MEDIUM_TEXT, 200, id="token_estimation"),
+        ],
+    )
+    def test_truncate_text_within_limit(
+        self, embedding_service: EmbeddingService, text: str, max_tokens: int
     ) -> None:
-        """Test text truncation respects sentence boundaries."""
-        text = "First sentence. Second sentence. Third sentence." + "A" * 1000
-        max_tokens = 100  # Will trigger truncation
-
+        """Test truncated text stays within max_tokens * 4 characters."""
         result = embedding_service._truncate_text(text, max_tokens)
 
-        # Should end at a sentence boundary if possible
-        assert result.endswith(".") or len(result) <= max_tokens * 4
+        assert len(result) <= max_tokens * 4
 
     def test_get_zero_vector(self, embedding_service: EmbeddingService) -> None:
         """Test zero vector generation."""
         zero_vector = embedding_service._get_zero_vector()
 
-        assert len(zero_vector) == 1536
-        assert all(value == 0.0 for value in zero_vector)
+        assert zero_vector == ZERO_VECTOR
 
     def test_is_available_with_api_key(
         self, embedding_service: EmbeddingService
@@ -168,7 +184,6 @@ class TestEmbeddingService:
         """Test availability check without API key."""
         assert embedding_service_no_key.is_available() is False
 
-    @pytest.mark.asyncio
     async def test_generate_embedding_api_error(
         self, embedding_service: EmbeddingService, mock_anthropic_client: Mock
     ) -> None:
@@ -181,14 +196,3 @@ class TestEmbeddingService:
 
             with pytest.raises(Exception, match="Numpy error"):
                 await embedding_service.generate_embedding(text)
-
-    def test_token_estimation(self, embedding_service: EmbeddingService) -> None:
-        """Test token estimation logic in text truncation."""
-        # Test the assumption that 1 token ≈ 4 characters
-        text = "A" * 1000  # 1000 characters
-        max_tokens = 200  # Should allow 800 characters
-
-        result = embedding_service._truncate_text(text, max_tokens)
-
-        # Should be around 800 characters (200 tokens * 4 chars)
-        assert len(result) <= 800
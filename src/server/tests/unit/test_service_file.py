@@ -1,41 +1,74 @@
 """File service tests."""
 
-import tempfile
+import hashlib
+import os
 from collections.abc import Generator
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from app.services.file_service import FileService
 
+# 3 lines, 9 words: "Line", "1", "Line", "2", "with", "multiple", "words", "Line", "3"
+SHARED_CONTENT = "Line 1\nLine 2 with multiple words\nLine 3"
+SHARED_SHA1 = hashlib.sha1(SHARED_CONTENT.encode()).hexdigest()
+OLD_MTIME_NS = 1_000_000_000
+
+
+@pytest.fixture(scope="session")
+def temp_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one temporary root shared by every file service test."""
+    return tmp_path_factory.mktemp("file_service_tests")
+
+
+@pytest.fixture(scope="module")
+def shared_md(temp_root: Path) -> Path:
+    """Write one read-only markdown file shared by the module's read tests."""
+    shared_dir = temp_root / "shared"
+    shared_dir.mkdir()
+    shared_file = shared_dir / "test.md"
+    shared_file.write_text(SHARED_CONTENT)
+    return shared_file
+
+
+@pytest.fixture(scope="module")
+def file_service() -> FileService:
+    """Create one file service instance shared across the module."""
+    return FileService()
+
+
+@pytest.fixture(autouse=True)
+def reset_file_service(file_service: FileService) -> Generator[None, None, None]:
+    """Restore docs_path after tests that point it at a temp directory."""
+    docs_path = file_service.docs_path
+    yield
+    file_service.docs_path = docs_path
+
 
 class TestFileService:
     """File service test class."""
 
     @pytest.fixture
-    def file_service(self) -> FileService:
-        """Create file service instance."""
-        return FileService()
-
-    @pytest.fixture
-    def temp_dir(self) -> Generator[Path, None, None]:
-        """Create temporary directory for tests."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    def temp_dir(self, temp_root: Path, request: pytest.FixtureRequest) -> Path:
+        """Create a per-test directory under the shared root."""
+        name: str = request.node.name
+        test_dir = temp_root / name
+        test_dir.mkdir()
+        return test_dir
 
     def test_init(self, file_service: FileService) -> None:
         """Test file service initialization."""
         assert file_service is not None
 
-    @pytest.mark.asyncio
     async def test_get_files_basic(
         self, file_service: FileService, temp_dir: Path
     ) -> None:
         """Test basic file listing."""
         # Create test files in temp directory
         test_file = temp_dir / "test.md"
-        test_file.write_text("# Test content")
+        test_file.touch()
 
         # Mock the docs_path to use temp directory
         file_service.docs_path = temp_dir
@@ -48,7 +81,6 @@ class TestFileService:
         assert len(result.files) >= 1
         assert any(f.name == "test.md" for f in result.files)
 
-    @pytest.mark.asyncio
     async def test_get_file_content_success(
         self, file_service: FileService, temp_dir: Path
     ) -> None:
@@ -68,18 +100,16 @@ class TestFileService:
         assert result.content == content
         assert result.name == "test.md"
 
-    @pytest.mark.asyncio
     async def test_get_file_content_not_found(
-        self, file_service: FileService, temp_dir: Path
+        self, file_service: FileService, temp_root: Path
     ) -> None:
         """Test file not found error."""
-        file_service.docs_path = temp_dir
+        file_service.docs_path = temp_root
 
         # Execute test and verify exception
         with pytest.raises(FileNotFoundError):
             await file_service.get_file_content("nonexistent.md")
 
-    @pytest.mark.asyncio
     async def test_get_file_content_not_a_file(
         self, file_service: FileService, temp_dir: Path
     ) -> None:
@@ -94,59 +124,81 @@ class TestFileService:
         with pytest.raises(ValueError):
             await file_service.get_file_content("testdir")
 
-    @pytest.mark.asyncio
     async def test_calculate_file_hash(
-        self, file_service: FileService, temp_dir: Path
+        self, file_service: FileService, shared_md: Path
     ) -> None:
         """Test file hash calculation."""
-        # Create test file
+        # Execute test
+        file_hash = await file_service._calculate_file_hash(shared_md)
+
+        # Verify result against the in-memory digest of the same content
+        assert file_hash == SHARED_SHA1
+
+    async def test_calculate_file_hash_cached(
+        self, file_service: FileService, temp_dir: Path
+    ) -> None:
+        """Test unchanged files are hashed once and edits invalidate the cache."""
         test_file = temp_dir / "test.md"
-        test_file.write_text("Test content for hash")
+        test_file.write_text(SHARED_CONTENT)
+        # Age the file past the race window so its hash is cached
+        os.utime(test_file, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
 
-        # Execute test
-        file_hash = await file_service._calculate_file_hash(test_file)
+        with patch(
+            "app.services.file_service.hashlib.sha1", wraps=hashlib.sha1
+        ) as sha1:
+            first = await file_service._calculate_file_hash(test_file)
+            second = await file_service._calculate_file_hash(test_file)
+            assert sha1.call_count == 1
 
-        # Verify result (should be a hash string)
-        assert isinstance(file_hash, str)
-        assert len(file_hash) > 0
+            test_file.write_text(SHARED_CONTENT + "\nLine 4")
+            third = await file_service._calculate_file_hash(test_file)
+            assert sha1.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_count_lines_words(
+        assert first == second == SHARED_SHA1
+        assert third != first
+
+    async def test_calculate_file_hash_same_size_rewrite(
         self, file_service: FileService, temp_dir: Path
     ) -> None:
-        """Test line and word counting."""
-        # Create test file with known content
-        content = "Line 1\nLine 2 with multiple words\nLine 3"
+        """Test a same-size rewrite within one mtime tick gets a new hash."""
         test_file = temp_dir / "test.md"
-        test_file.write_text(content)
+        test_file.write_text("# Version A")
+        first = await file_service._calculate_file_hash(test_file)
+        mtime_ns = test_file.stat().st_mtime_ns
+
+        # Rewrite with identical size and force the same mtime
+        test_file.write_text("# Version B")
+        os.utime(test_file, ns=(mtime_ns, mtime_ns))
+        second = await file_service._calculate_file_hash(test_file)
+
+        assert first == hashlib.sha1(b"# Version A").hexdigest()
+        assert second == hashlib.sha1(b"# Version B").hexdigest()
 
+    async def test_count_lines_words(
+        self, file_service: FileService, shared_md: Path
+    ) -> None:
+        """Test line and word counting."""
         # Execute test
-        line_count, word_count = await file_service._count_lines_words(test_file)
+        line_count, word_count = await file_service._count_lines_words(shared_md)
 
         # Verify results
         assert line_count == 3
-        # "Line", "1", "Line", "2", "with", "multiple", "words", "Line", "3" = 9 words
         assert word_count == 9
 
-    @pytest.mark.asyncio
     async def test_get_file_metadata(
-        self, file_service: FileService, temp_dir: Path
+        self, file_service: FileService, shared_md: Path
     ) -> None:
         """Test file metadata retrieval."""
-        # Create test file
-        test_file = temp_dir / "test.md"
-        test_file.write_text("# Test\nContent")
-
-        file_service.docs_path = temp_dir
+        file_service.docs_path = shared_md.parent
 
         # Execute test
-        metadata = await file_service._get_file_metadata(test_file)
+        metadata = await file_service._get_file_metadata(shared_md)
 
         # Verify results
         assert metadata.name == "test.md"
         assert metadata.size > 0
         assert isinstance(metadata.last_modified, datetime)
         assert isinstance(metadata.created, datetime)
-        assert metadata.hash
+        assert metadata.hash == SHARED_SHA1
         assert metadata.line_count and metadata.line_count > 0
         assert metadata.word_count and metadata.word_count > 0
@@ -1,7 +1,9 @@
 """Tests for FileWatcherService."""
 
+import os
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -24,18 +26,15 @@ class TestFileWatcherService:
         return mock_service
 
     @pytest.fixture
-    def mock_observer(self) -> Mock:
-        """Mock watchdog observer."""
-        mock_observer = Mock()
-        mock_observer.start = Mock()
-        mock_observer.stop = Mock()
-        mock_observer.join = Mock()
-        mock_observer.is_alive = Mock(return_value=False)
-        return mock_observer
+    def mock_observer(self) -> SimpleNamespace:
+        """Stub watchdog observer; only the asserted methods are Mocks."""
+        return SimpleNamespace(
+            start=Mock(), stop=Mock(), join=Mock(), is_alive=lambda: False
+        )
 
     @pytest.fixture
     def file_watcher_service(
-        self, mock_queue_service: Mock, mock_observer: Mock
+        self, mock_queue_service: Mock, mock_observer: SimpleNamespace
     ) -> FileWatcherService:
         """Create FileWatcherService with mocked dependencies."""
         with (
@@ -49,13 +48,18 @@ class TestFileWatcherService:
             service.observer = mock_observer
             return service
 
+    @pytest.fixture
+    def bare_watcher(self) -> FileWatcherService:
+        """Unpatched FileWatcherService; __init__ neither connects nor observes."""
+        return FileWatcherService()
+
     @pytest.fixture
     def temp_watch_directory(self) -> Path:  # type: ignore[misc]
         """Create temporary directory for watching."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            watch_dir = Path(tmpdir) / "watch_test"
-            watch_dir.mkdir()
-            yield watch_dir
+            watch_dir = os.path.join(tmpdir, "watch_test")
+            os.mkdir(watch_dir)
+            yield Path(watch_dir)
 
     @pytest.fixture
     def watcher_config(self, temp_watch_directory: Path) -> WatcherConfig:
@@ -68,45 +72,42 @@ class TestFileWatcherService:
             recursive=True,
         )
 
-    def test_init(self, file_watcher_service: FileWatcherService) -> None:
+    def test_init(self, bare_watcher: FileWatcherService) -> None:
         """Test file watcher service initialization."""
-        assert file_watcher_service is not None
-        assert hasattr(file_watcher_service, "observer")
-        assert hasattr(file_watcher_service, "queue_service")
+        assert bare_watcher is not None
+        assert hasattr(bare_watcher, "observer")
+        assert hasattr(bare_watcher, "queue_service")
 
-    @pytest.mark.asyncio
     async def test_start_success(
-        self, file_watcher_service: FileWatcherService, mock_observer: Mock
+        self, file_watcher_service: FileWatcherService, mock_observer: SimpleNamespace
     ) -> None:
         """Test successful watcher startup."""
-        mock_observer.is_alive.return_value = False
+        mock_observer.is_alive = lambda: False
 
         await file_watcher_service.start()
 
         mock_observer.start.assert_called_once()
         # Note: is_running attribute not implemented in current service
 
-    @pytest.mark.asyncio
     async def test_start_already_running(
-        self, file_watcher_service: FileWatcherService, mock_observer: Mock
+        self, file_watcher_service: FileWatcherService, mock_observer: SimpleNamespace
     ) -> None:
         """Test starting watcher when already running."""
         # Set observer to simulate already running
         file_watcher_service.observer = mock_observer
-        mock_observer.is_alive.return_value = True
+        mock_observer.is_alive = lambda: True
 
         await file_watcher_service.start()
 
         # Should not start again if already running
         mock_observer.start.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_stop_success(
-        self, file_watcher_service: FileWatcherService, mock_observer: Mock
+        self, file_watcher_service: FileWatcherService, mock_observer: SimpleNamespace
     ) -> None:
         """Test successful watcher shutdown."""
         file_watcher_service.observer = mock_observer
-        mock_observer.is_alive.return_value = True
+        mock_observer.is_alive = lambda: True
 
         await file_watcher_service.stop()
 
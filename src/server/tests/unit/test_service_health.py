@@ -7,107 +7,60 @@ import pytest
 from app.services.health_service import HealthService
 
 
+@pytest.fixture(scope="module")
+def health_service() -> HealthService:
+    """Create one stateless health service instance shared across the module."""
+    return HealthService()
+
+
+@pytest.fixture
+def health_mocks(monkeypatch: pytest.MonkeyPatch) -> tuple[AsyncMock, AsyncMock]:
+    """Replace both component checks with AsyncMocks (text search, Claude)."""
+    mock_text = AsyncMock()
+    mock_claude = AsyncMock()
+    monkeypatch.setattr(HealthService, "_check_text_search", mock_text)
+    monkeypatch.setattr(HealthService, "_check_claude_code", mock_claude)
+    return mock_text, mock_claude
+
+
 class TestHealthService:
     """Health service test class."""
 
-    @pytest.fixture
-    def health_service(self) -> HealthService:
-        """Create health service instance."""
-        return HealthService()
-
     def test_init(self, health_service: HealthService) -> None:
         """Test health service initialization."""
         assert health_service is not None
 
-    @pytest.mark.asyncio
-    @patch("app.services.health_service.HealthService._check_text_search")
-    @patch("app.services.health_service.HealthService._check_claude_code")
-    async def test_get_detailed_health_all_healthy(
-        self,
-        mock_claude: AsyncMock,
-        mock_text: AsyncMock,
-        health_service: HealthService,
-    ) -> None:
-        """Test detailed health when all services are healthy."""
-        # Setup mocks
-        mock_text.return_value = True
-        mock_claude.return_value = True
-
-        # Execute test
-        result = await health_service.get_detailed_health()
-
-        # Verify results
-        assert result.text_search is True
-        assert result.claude_code is True
-        assert result.overall is True
-
-    @pytest.mark.asyncio
-    @patch("app.services.health_service.HealthService._check_text_search")
-    @patch("app.services.health_service.HealthService._check_claude_code")
-    async def test_get_detailed_health_text_search_failed(
+    @pytest.mark.parametrize(
+        ("text_search", "claude_code", "overall"),
+        [
+            pytest.param(True, True, True, id="all_healthy"),
+            pytest.param(False, True, False, id="text_search_failed"),
+            pytest.param(True, False, False, id="claude_failed"),
+            pytest.param(False, False, False, id="all_failed"),
+        ],
+    )
+    async def test_get_detailed_health(
         self,
-        mock_claude: AsyncMock,
-        mock_text: AsyncMock,
         health_service: HealthService,
+        health_mocks: tuple[AsyncMock, AsyncMock],
+        text_search: bool,
+        claude_code: bool,
+        overall: bool,
     ) -> None:
-        """Test detailed health when text search fails."""
+        """Test detailed health reflects each component check."""
         # Setup mocks
-        mock_text.return_value = False
-        mock_claude.return_value = True
+        mock_text, mock_claude = health_mocks
+        mock_text.return_value = text_search
+        mock_claude.return_value = claude_code
 
         # Execute test
         result = await health_service.get_detailed_health()
 
         # Verify results
-        assert result.text_search is False
-        assert result.claude_code is True
-        assert result.overall is False
-
-    @pytest.mark.asyncio
-    @patch("app.services.health_service.HealthService._check_text_search")
-    @patch("app.services.health_service.HealthService._check_claude_code")
-    async def test_get_detailed_health_claude_failed(
-        self,
-        mock_claude: AsyncMock,
-        mock_text: AsyncMock,
-        health_service: HealthService,
-    ) -> None:
-        """Test detailed health when Claude service fails."""
-        # Setup mocks
-        mock_text.return_value = True
-        mock_claude.return_value = False
+        assert result.text_search is text_search
+        assert result.claude_code is claude_code
+        assert result.overall is overall
 
-        # Execute test
-        result = await health_service.get_detailed_health()
-
-        # Verify results
-        assert result.text_search is True
-        assert result.claude_code is False
-        assert result.overall is False
-
-    @pytest.mark.asyncio
-    @patch("app.services.health_service.HealthService._check_text_search")
-    @patch("app.services.health_service.HealthService._check_claude_code")
-    async def test_get_detailed_health_all_failed(
-        self,
-        mock_claude: AsyncMock,
-        mock_text: AsyncMock,
-        health_service: HealthService,
-    ) -> None:
-        """Test detailed health when all services fail."""
-        # Setup mocks
-        mock_text.return_value = False
-        mock_claude.return_value = False
-
-        # Execute test
-        result = await health_service.get_detailed_health()
-
-        # Verify results
-        assert result.text_search is False
-        assert result.claude_code is False
-        assert result.overall is False
-
-    @pytest.mark.asyncio
     async def test_check_text_search_success(
         self, health_service: HealthService
     ) -> None:
@@ -118,7 +71,6 @@ class TestHealthService:
         # Verify result
         assert result is True
 
-    @pytest.mark.asyncio
     async def test_check_text_search_failure(
         self, health_service: HealthService
     ) -> None:
@@ -138,29 +90,26 @@ class TestHealthService:
                 # If implementation lets exception bubble up, that's also valid behavior
                 assert True
 
-    @pytest.mark.asyncio
     async def test_check_claude_code_success(
-        self, health_service: HealthService
+        self, health_service: HealthService, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test Claude Code health check success."""
         # Execute test with proper API key
-        with patch("app.core.config.settings.anthropic_api_key", "valid-key"):
-            result = await health_service._check_claude_code()
-            # Should return True when API key is present
-            assert result is True
+        monkeypatch.setattr("app.core.config.settings.anthropic_api_key", "valid-key")
+        result = await health_service._check_claude_code()
+        # Should return True when API key is present
+        assert result is True
 
-    @pytest.mark.asyncio
     async def test_check_claude_code_no_api_key(
-        self, health_service: HealthService
+        self, health_service: HealthService, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test Claude Code health check with no API key."""
         # Execute test without API key
-        with patch("app.core.config.settings.anthropic_api_key", None):
-            result = await health_service._check_claude_code()
-            # Should return False when no API key
-            assert result is False
+        monkeypatch.setattr("app.core.config.settings.anthropic_api_key", None)
+        result = await health_service._check_claude_code()
+        # Should return False when no API key
+        assert result is False
 
-    @pytest.mark.asyncio
     async def test_check_claude_code_api_failure(
         self, health_service: HealthService
     ) -> None:
@@ -1,25 +1,34 @@
 """Test manifest service."""
 
-import tempfile
-from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
 
 from app.services.manifest_service import ManifestService
 
 
 @pytest.fixture
-def temp_manifest_service() -> Iterator[ManifestService]:
-    """Create temporary manifest service for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        service = ManifestService()
-        service.docs_path = Path(temp_dir)
-        service.manifest_path = service.docs_path / ".specmgr-manifest.json"
-        yield service
+def temp_manifest_service(fs: FakeFilesystem) -> ManifestService:
+    """Create manifest service backed by an in-memory fake filesystem."""
+    docs_path = Path("/docs")
+    fs.create_dir(docs_path)
+    service = ManifestService()
+    service.docs_path = docs_path
+    service.manifest_path = docs_path / ".specmgr-manifest.json"
+    return service
+
+
+@pytest.fixture
+def corrupt_manifest(
+    temp_manifest_service: ManifestService, request: pytest.FixtureRequest
+) -> ManifestService:
+    """Manifest service whose manifest holds invalid JSON (bytes via indirect param)."""
+    content = getattr(request, "param", b"invalid json content")
+    temp_manifest_service.manifest_path.write_bytes(content)
+    return temp_manifest_service
 
 
-@pytest.mark.asyncio
 async def test_load_empty_manifest(temp_manifest_service: ManifestService) -> None:
     """Test loading non-existent manifest."""
     manifest = await temp_manifest_service.load_manifest()
@@ -28,7 +37,6 @@ async def test_load_empty_manifest(temp_manifest_service: ManifestService) -> No
     assert manifest["last_updated"] is None
 
 
-@pytest.mark.asyncio
 async def test_save_and_load_manifest(temp_manifest_service: ManifestService) -> None:
     """Test saving and loading manifest."""
     test_manifest = {
@@ -43,7 +51,6 @@ async def test_save_and_load_manifest(temp_manifest_service: ManifestService) ->
     assert loaded_manifest["last_updated"] is not None
 
 
-@pytest.mark.asyncio
 async def test_get_file_changes_empty_manifest(
     temp_manifest_service: ManifestService,
 ) -> None:
@@ -54,12 +61,11 @@ async def test_get_file_changes_empty_manifest(
         current_files
     )
 
-    assert added == ["docs/new.md", "docs/another.md"]
-    assert modified == []
-    assert deleted == []
+    assert set(added) == {"docs/new.md", "docs/another.md"}
+    assert not modified
+    assert not deleted
 
 
-@pytest.mark.asyncio
 async def test_get_file_changes_with_modifications(
     temp_manifest_service: ManifestService,
 ) -> None:
@@ -86,28 +92,31 @@ async def test_get_file_changes_with_modifications(
         current_files
     )
 
-    assert added == ["docs/new.md"]
-    assert modified == ["docs/modified.md"]
-    assert deleted == ["docs/deleted.md"]
+    assert set(added) == {"docs/new.md"}
+    assert set(modified) == {"docs/modified.md"}
+    assert set(deleted) == {"docs/deleted.md"}
 
 
-@pytest.mark.asyncio
-async def test_update_file_in_manifest(temp_manifest_service: ManifestService) -> None:
-    """Test updating single file in manifest."""
-    # Initial manifest
-    await temp_manifest_service.update_file_in_manifest("docs/test.md", "hash1")
-
-    manifest = await temp_manifest_service.load_manifest()
-    assert manifest["files"]["docs/test.md"] == "hash1"
+@pytest.mark.parametrize(
+    "initial_files",
+    [
+        pytest.param({"docs/test.md": "hash1"}, id="update_existing"),
+        pytest.param({}, id="insert_new"),
+    ],
+)
+async def test_update_file_in_manifest(
+    temp_manifest_service: ManifestService, initial_files: dict[str, str]
+) -> None:
+    """Test updating an existing entry or adding one to an empty manifest."""
+    if initial_files:
+        await temp_manifest_service.save_manifest({"files": initial_files})
 
-    # Update same file
     await temp_manifest_service.update_file_in_manifest("docs/test.md", "hash2")
 
     manifest = await temp_manifest_service.load_manifest()
-    assert manifest["files"]["docs/test.md"] == "hash2"
+    assert manifest["files"] == {"docs/test.md": "hash2"}
 
 
-@pytest.mark.asyncio
 async def test_remove_file_from_manifest(
     temp_manifest_service: ManifestService,
 ) -> None:
@@ -124,7 +133,6 @@ async def test_remove_file_from_manifest(
     assert "docs/keep.md" in manifest["files"]
 
 
-@pytest.mark.asyncio
 async def test_get_manifest_stats(temp_manifest_service: ManifestService) -> None:
     """Test manifest statistics."""
     # Initially empty
@@ -134,8 +142,9 @@ async def test_get_manifest_stats(temp_manifest_service: ManifestService) -> Non
     assert stats["manifest_exists"] is False
 
     # Add some files
-    await temp_manifest_service.update_file_in_manifest("docs/test1.md", "hash1")
-    await temp_manifest_service.update_file_in_manifest("docs/test2.md", "hash2")
+    await temp_manifest_service.save_manifest(
+        {"files": {"docs/test1.md": "hash1", "docs/test2.md": "hash2"}}
+    )
 
     stats = await temp_manifest_service.get_manifest_stats()
     assert stats["total_files"] == 2
@@ -144,7 +153,6 @@ async def test_get_manifest_stats(temp_manifest_service: ManifestService) -> Non
     assert stats["manifest_size"] > 0
 
 
-@pytest.mark.asyncio
 async def test_clear_manifest(temp_manifest_service: ManifestService) -> None:
     """Test clearing manifest."""
     # Add some data
@@ -157,16 +165,11 @@ async def test_clear_manifest(temp_manifest_service: ManifestService) -> None:
     assert stats["manifest_exists"] is False
 
 
-@pytest.mark.asyncio
 async def test_corrupted_manifest_handling(
-    temp_manifest_service: ManifestService,
+    corrupt_manifest: ManifestService,
 ) -> None:
     """Test handling of corrupted manifest file."""
-    # Write invalid JSON
-    with open(temp_manifest_service.manifest_path, "w") as f:
-        f.write("invalid json content")
-
     # Should return empty manifest without crashing
-    manifest = await temp_manifest_service.load_manifest()
+    manifest = await corrupt_manifest.load_manifest()
     assert manifest["files"] == {}
     assert manifest["last_updated"] is None
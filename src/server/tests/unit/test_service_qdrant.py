@@ -1,6 +1,7 @@
 """Tests for QdrantService."""
 
 from collections.abc import Generator
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,24 +9,51 @@ from qdrant_client.http.models import PointStruct, VectorParams
 
 from app.services.qdrant_service import QdrantService
 
+# Point ID for "test/document.md": UUID of the first 32 hex chars of its SHA-256
+EXPECTED_UUID = "463c21bd-fd32-fdb5-f3e4-7784d32ce619"
+
+COLLECTION_INFO = SimpleNamespace(
+    vectors_count=10,
+    indexed_vectors_count=8,
+    points_count=10,
+    config=SimpleNamespace(
+        params=SimpleNamespace(
+            vectors=SimpleNamespace(size=1536, distance=SimpleNamespace(value="Cosine"))
+        )
+    ),
+)
+
+
+@pytest.fixture(scope="module")
+def mock_qdrant_client() -> Generator[Mock, None, None]:
+    """Mock QdrantClient, patched once for the whole module."""
+    with patch("app.services.qdrant_service.QdrantClient") as mock_client_class:
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+        yield mock_client
+
+
+@pytest.fixture(scope="module")
+def qdrant_service(mock_qdrant_client: Mock) -> QdrantService:
+    """Create QdrantService instance with mocked client."""
+    return QdrantService()
+
+
+@pytest.fixture(scope="module")
+def sample_vector() -> list[float]:
+    """Read-only 1536-dimension vector shared by the module."""
+    return [0.1, 0.2, 0.3] * 512
 
-class TestQdrantService:
-    """Test QdrantService functionality."""
 
-    @pytest.fixture
-    def mock_qdrant_client(self) -> Generator[Mock, None, None]:
-        """Mock QdrantClient."""
-        with patch("app.services.qdrant_service.QdrantClient") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-            yield mock_client
+@pytest.fixture(autouse=True)
+def reset_qdrant_client(mock_qdrant_client: Mock) -> None:
+    """Clear calls and configured results left on the shared client mock."""
+    mock_qdrant_client.reset_mock(return_value=True, side_effect=True)
 
-    @pytest.fixture
-    def qdrant_service(self, mock_qdrant_client: Mock) -> QdrantService:
-        """Create QdrantService instance with mocked client."""
-        return QdrantService()
 
-    @pytest.mark.asyncio
+class TestQdrantService:
+    """Test QdrantService functionality."""
+
     async def test_initialize_collection_creates_new_collection(
         self, qdrant_service: QdrantService, mock_qdrant_client: Mock
     ) -> None:
@@ -43,7 +71,6 @@ class TestQdrantService:
         assert call_args[1]["collection_name"] == "documents"
         assert isinstance(call_args[1]["vectors_config"], VectorParams)
 
-    @pytest.mark.asyncio
     async def test_initialize_collection_skips_existing_collection(
         self, qdrant_service: QdrantService, mock_qdrant_client: Mock
     ) -> None:
@@ -60,16 +87,17 @@ class TestQdrantService:
         # Verify collection creation was NOT called
         mock_qdrant_client.create_collection.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_store_document(
-        self, qdrant_service: QdrantService, mock_qdrant_client: Mock
+        self,
+        qdrant_service: QdrantService,
+        mock_qdrant_client: Mock,
+        sample_vector: list[float],
     ) -> None:
         """Test document storage."""
         file_path = "test/document.md"
         content = "# Test Document\n\nThis is a test."
-        vector = [0.1, 0.2, 0.3] * 512  # 1536 dimensions
 
-        await qdrant_service.store_document(file_path, content, vector)
+        await qdrant_service.store_document(file_path, content, sample_vector)
 
         # Verify upsert was called
         mock_qdrant_client.upsert.assert_called_once()
@@ -81,19 +109,21 @@ class TestQdrantService:
 
         point = points[0]
         assert isinstance(point, PointStruct)
-        assert point.vector == vector
+        assert point.id == EXPECTED_UUID
+        assert point.vector == sample_vector
         assert point.payload is not None
         assert point.payload["path"] == file_path
         assert point.payload["body"] == content
         assert point.payload["file_name"] == "document.md"
         assert "indexed_at" in point.payload
 
-    @pytest.mark.asyncio
     async def test_search_documents(
-        self, qdrant_service: QdrantService, mock_qdrant_client: Mock
+        self,
+        qdrant_service: QdrantService,
+        mock_qdrant_client: Mock,
+        sample_vector: list[float],
     ) -> None:
         """Test document search."""
-        query_vector = [0.1, 0.2, 0.3] * 512  # 1536 dimensions
 
         # Mock search result
         mock_scored_point = Mock()
@@ -108,7 +138,7 @@ class TestQdrantService:
         mock_qdrant_client.search.return_value = [mock_scored_point]
 
         results = await qdrant_service.search_documents(
-            query_vector=query_vector,
+            query_vector=sample_vector,
             limit=10,
             score_threshold=0.5,
         )
@@ -116,7 +146,7 @@ class TestQdrantService:
         # Verify search was called
         mock_qdrant_client.search.assert_called_once_with(
             collection_name="documents",
-            query_vector=query_vector,
+            query_vector=sample_vector,
             limit=10,
             score_threshold=0.5,
             with_payload=True,
@@ -131,7 +161,6 @@ class TestQdrantService:
         assert result["body"] == "Test content"
         assert result["file_name"] == "document.md"
 
-    @pytest.mark.asyncio
     async def test_delete_document(
         self, qdrant_service: QdrantService, mock_qdrant_client: Mock
     ) -> None:
@@ -145,62 +174,39 @@ class TestQdrantService:
         call_args = mock_qdrant_client.delete.call_args
         assert call_args[1]["collection_name"] == "documents"
 
-    @pytest.mark.asyncio
-    async def test_document_exists_returns_true(
-        self, qdrant_service: QdrantService, mock_qdrant_client: Mock
+    @pytest.mark.parametrize(
+        ("retrieved", "side_effect", "expected"),
+        [
+            pytest.param([Mock()], None, True, id="returns_true"),
+            pytest.param([], None, False, id="returns_false"),
+            pytest.param(
+                None, Exception("Connection error"), False, id="handles_exception"
+            ),
+        ],
+    )
+    async def test_document_exists(
+        self,
+        qdrant_service: QdrantService,
+        mock_qdrant_client: Mock,
+        retrieved: list[Mock] | None,
+        side_effect: Exception | None,
+        expected: bool,
     ) -> None:
-        """Test document existence check when document exists."""
+        """Test document existence check for hit, miss and client errors."""
         file_path = "test/document.md"
-
-        # Mock document exists
-        mock_qdrant_client.retrieve.return_value = [Mock()]
+        mock_qdrant_client.retrieve.return_value = retrieved
+        mock_qdrant_client.retrieve.side_effect = side_effect
 
         exists = await qdrant_service.document_exists(file_path)
 
-        assert exists is True
+        assert exists is expected
         mock_qdrant_client.retrieve.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_document_exists_returns_false(
-        self, qdrant_service: QdrantService, mock_qdrant_client: Mock
-    ) -> None:
-        """Test document existence check when document doesn't exist."""
-        file_path = "test/document.md"
-
-        # Mock document doesn't exist
-        mock_qdrant_client.retrieve.return_value = []
-
-        exists = await qdrant_service.document_exists(file_path)
-
-        assert exists is False
-
-    @pytest.mark.asyncio
-    async def test_document_exists_handles_exception(
-        self, qdrant_service: QdrantService, mock_qdrant_client: Mock
-    ) -> None:
-        """Test document existence check handles exceptions."""
-        file_path = "test/document.md"
-
-        # Mock exception
-        mock_qdrant_client.retrieve.side_effect = Exception("Connection error")
-
-        exists = await qdrant_service.document_exists(file_path)
-
-        assert exists is False
-
-    @pytest.mark.asyncio
     async def test_get_collection_info(
         self, qdrant_service: QdrantService, mock_qdrant_client: Mock
     ) -> None:
         """Test collection info retrieval."""
-        # Mock collection info
-        mock_info = Mock()
-        mock_info.vectors_count = 10
-        mock_info.indexed_vectors_count = 8
-        mock_info.points_count = 10
-        mock_info.config.params.vectors.size = 1536
-        mock_info.config.params.vectors.distance.value = "Cosine"
-        mock_qdrant_client.get_collection.return_value = mock_info
+        mock_qdrant_client.get_collection.return_value = COLLECTION_INFO
 
         info = await qdrant_service.get_collection_info()
 
@@ -209,19 +215,3 @@ class TestQdrantService:
         assert info["points_count"] == 10
         assert info["config"]["vector_size"] == 1536
         assert info["config"]["distance"] == "Cosine"
-
-    def test_uuid_generation_consistency(self, qdrant_service: QdrantService) -> None:
-        """Test that the same file path generates the same UUID."""
-        import hashlib
-        import uuid
-
-        file_path = "test/document.md"
-
-        # Generate UUID manually
-        path_hash = hashlib.md5(file_path.encode()).hexdigest()
-        expected_uuid = str(uuid.UUID(path_hash))
-
-        # Test in store_document method by checking if the same UUID is generated
-        # This is implicitly tested by the consistency of operations
-        assert len(expected_uuid) == 36  # Standard UUID length
-        assert expected_uuid.count("-") == 4  # Standard UUID format
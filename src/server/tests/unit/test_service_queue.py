@@ -9,44 +9,59 @@ from app.models.error_types import QueueConnectionError, QueueError
 from app.models.queue_types import JobPriority
 from app.services.queue_service import QueueService
 
+# Read-only job payload; add_sync_job wraps it without mutating it
+SAMPLE_JOB_DATA: dict = {
+    "job_id": "test_job_123",
+    "job_type": "sync_file",
+    "file_path": "/docs/test.md",
+    "priority": JobPriority.NORMAL,
+    "retry_count": 0,
+    "created_at": 1640995200.0,
+    "metadata": {"test": "data"},
+}
+
+
+def _configure_redis_client(mock_client: Mock) -> None:
+    """Install the default async Redis command stubs."""
+    mock_client.ping = AsyncMock(return_value=True)
+    mock_client.lpush = AsyncMock(return_value=1)
+    mock_client.rpop = AsyncMock(return_value=None)
+    mock_client.llen = AsyncMock(return_value=0)
+    mock_client.info = AsyncMock(return_value={"connected_clients": 1})
+
+
+@pytest.fixture(scope="module")
+def mock_redis_client() -> Mock:
+    """Mock Redis client shared across the module."""
+    return Mock()
+
+
+@pytest.fixture(scope="module")
+def queue_service(mock_redis_client: Mock) -> QueueService:
+    """Create QueueService with mocked Redis client."""
+    with patch(
+        "app.services.queue_service.redis.Redis", return_value=mock_redis_client
+    ):
+        return QueueService()
+
+
+@pytest.fixture(scope="module")
+def no_client_queue_service() -> QueueService:
+    """QueueService that was never started (no Redis client)."""
+    return QueueService()
+
+
+@pytest.fixture(autouse=True)
+def reset_queue_service(queue_service: QueueService, mock_redis_client: Mock) -> None:
+    """Restore the shared Redis mock and reattach it before each test."""
+    mock_redis_client.reset_mock(return_value=True, side_effect=True)
+    _configure_redis_client(mock_redis_client)
+    queue_service.redis_client = mock_redis_client
+
 
 class TestQueueService:
     """Test QueueService functionality."""
 
-    @pytest.fixture
-    def mock_redis_client(self) -> Mock:
-        """Mock Redis client."""
-        mock_client = Mock()
-        mock_client.ping = AsyncMock(return_value=True)
-        mock_client.lpush = AsyncMock(return_value=1)
-        mock_client.rpop = AsyncMock(return_value=None)
-        mock_client.llen = AsyncMock(return_value=0)
-        mock_client.info = AsyncMock(return_value={"connected_clients": 1})
-        return mock_client
-
-    @pytest.fixture
-    def queue_service(self, mock_redis_client: Mock) -> QueueService:
-        """Create QueueService with mocked Redis client."""
-        with patch(
-            "app.services.queue_service.redis.Redis", return_value=mock_redis_client
-        ):
-            service = QueueService()
-            service.redis_client = mock_redis_client
-            return service
-
-    @pytest.fixture
-    def sample_job_data(self) -> dict:
-        """Sample job data for testing."""
-        return {
-            "job_id": "test_job_123",
-            "job_type": "sync_file",
-            "file_path": "/docs/test.md",
-            "priority": JobPriority.NORMAL,
-            "retry_count": 0,
-            "created_at": 1640995200.0,
-            "metadata": {"test": "data"},
-        }
-
     def test_init(self, queue_service: QueueService) -> None:
         """Test queue service initialization."""
         assert queue_service is not None
@@ -54,7 +69,7 @@ class TestQueueService:
         assert queue_service.max_retries == 5
         # Note: retry_delay not implemented as instance variable
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_start_success(
         self, queue_service: QueueService, mock_redis_client: Mock
     ) -> None:
@@ -67,7 +82,7 @@ class TestQueueService:
         mock_redis_client.ping.assert_called_once()
         # Note: is_running attribute not implemented in current service
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_start_connection_failure(
         self, queue_service: QueueService, mock_redis_client: Mock
     ) -> None:
@@ -79,7 +94,6 @@ class TestQueueService:
 
         # Note: is_running attribute not implemented in current service
 
-    @pytest.mark.asyncio
     async def test_stop_success(
         self, queue_service: QueueService, mock_redis_client: Mock
     ) -> None:
@@ -90,77 +104,79 @@ class TestQueueService:
 
         mock_redis_client.close.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_stop_when_no_client(self, mock_redis_client: Mock) -> None:
+    async def test_stop_when_no_client(
+        self, no_client_queue_service: QueueService
+    ) -> None:
         """Test stopping queue service when no client."""
-        queue_service = QueueService()
-        queue_service.redis_client = None
-
         # Should not raise error when no client
-        await queue_service.stop()
+        await no_client_queue_service.stop()
 
-    @pytest.mark.asyncio
     async def test_add_sync_job_success(
         self,
         queue_service: QueueService,
         mock_redis_client: Mock,
-        sample_job_data: dict,
     ) -> None:
         """Test successful sync job addition."""
         mock_redis_client.rpush.return_value = 1
 
-        result = await queue_service.add_sync_job(sample_job_data)
+        result = await queue_service.add_sync_job(SAMPLE_JOB_DATA)
 
         mock_redis_client.rpush.assert_called_once()
         assert isinstance(result, str)  # Returns job ID
 
-    @pytest.mark.asyncio
-    async def test_add_sync_job_no_client(self, sample_job_data: dict) -> None:
-        """Test sync job addition when no Redis client."""
-        queue_service = QueueService()
-        queue_service.redis_client = None
-
-        with pytest.raises(QueueConnectionError):
-            await queue_service.add_sync_job(sample_job_data)
-
-    @pytest.mark.asyncio
-    async def test_add_sync_job_redis_error(
+    @pytest.mark.parametrize(
+        ("service_fixture", "expected_error"),
+        [
+            pytest.param(
+                "no_client_queue_service", QueueConnectionError, id="no_client"
+            ),
+            pytest.param("queue_service", QueueError, id="redis_error"),
+        ],
+    )
+    async def test_add_sync_job_failure(
         self,
-        queue_service: QueueService,
+        request: pytest.FixtureRequest,
         mock_redis_client: Mock,
-        sample_job_data: dict,
+        service_fixture: str,
+        expected_error: type[Exception],
     ) -> None:
-        """Test sync job addition with Redis error."""
-        mock_redis_client.rpush.side_effect = redis.RedisError("Redis error")
-
-        with pytest.raises(QueueError):
-            await queue_service.add_sync_job(sample_job_data)
-
-    @pytest.mark.asyncio
-    async def test_get_queue_stats_success(
-        self, queue_service: QueueService, mock_redis_client: Mock
+        """Test sync job addition without a client or with a Redis error."""
+        service: QueueService = request.getfixturevalue(service_fixture)
+        if service_fixture == "queue_service":
+            mock_redis_client.rpush.side_effect = redis.RedisError("Redis error")
+
+        with pytest.raises(expected_error):
+            await service.add_sync_job(SAMPLE_JOB_DATA)
+
+    @pytest.mark.parametrize(
+        ("service_fixture", "expected"),
+        [
+            pytest.param(
+                "queue_service", {"pending": 5, "retry": 5, "failed": 5}, id="success"
+            ),
+            pytest.param(
+                "no_client_queue_service",
+                {"pending": 0, "retry": 0, "failed": 0},
+                id="no_client",
+            ),
+        ],
+    )
+    async def test_get_queue_stats(
+        self,
+        request: pytest.FixtureRequest,
+        mock_redis_client: Mock,
+        service_fixture: str,
+        expected: dict[str, int],
     ) -> None:
-        """Test successful queue stats retrieval."""
-        mock_redis_client.llen.return_value = 5
-
-        stats = await queue_service.get_queue_stats()
-
-        # Should call llen for different queues
-        assert mock_redis_client.llen.call_count >= 1
-        assert isinstance(stats, dict)
-        assert "pending" in stats
-        assert stats["pending"] == 5
+        """Test queue stats retrieval with and without a Redis client."""
+        service: QueueService = request.getfixturevalue(service_fixture)
+        if service_fixture == "queue_service":
+            mock_redis_client.llen.return_value = 5
 
-    @pytest.mark.asyncio
-    async def test_get_queue_stats_no_client(self) -> None:
-        """Test queue stats retrieval when no Redis client."""
-        queue_service = QueueService()
-        queue_service.redis_client = None
+        stats = await service.get_queue_stats()
 
-        stats = await queue_service.get_queue_stats()
-        assert stats == {"pending": 0, "retry": 0, "failed": 0}
+        assert stats == expected
 
-    @pytest.mark.asyncio
     async def test_get_queue_stats_redis_error(
         self, queue_service: QueueService, mock_redis_client: Mock
     ) -> None:
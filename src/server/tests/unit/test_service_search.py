@@ -1,6 +1,6 @@
 """Search service tests."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -8,22 +8,29 @@ from app.models.api_models import SearchResult, SearchResultMetadata
 from app.services.search_service import SearchService
 
 
+@pytest.fixture(scope="module")
+def search_service() -> SearchService:
+    """Create one search service instance shared across the module."""
+    return SearchService()
+
+
+@pytest.fixture
+def mock_text_search(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace SearchService._simple_text_search with an AsyncMock."""
+    mock_search = AsyncMock(return_value=[])
+    monkeypatch.setattr(SearchService, "_simple_text_search", mock_search)
+    return mock_search
+
+
 class TestSearchService:
     """Search service test class."""
 
-    @pytest.fixture
-    def search_service(self) -> SearchService:
-        """Create search service instance."""
-        return SearchService()
-
     def test_init(self, search_service: SearchService) -> None:
         """Test search service initialization."""
         assert search_service is not None
 
-    @pytest.mark.asyncio
-    @patch("app.services.search_service.SearchService._simple_text_search")
     async def test_search_text_success(
-        self, mock_text_search: AsyncMock, search_service: SearchService
+        self, search_service: SearchService, mock_text_search: AsyncMock
     ) -> None:
         """Test successful text search."""
         # Setup mock - return list of proper SearchResult objects
@@ -49,7 +56,6 @@ class TestSearchService:
         assert result.total_results == 1  # Should have 1 result from mock
         assert result.query == "test query"
 
-    @pytest.mark.asyncio
     async def test_get_stats_success(self, search_service: SearchService) -> None:
         """Test successful stats retrieval."""
         # Execute test
@@ -59,15 +65,9 @@ class TestSearchService:
         assert hasattr(result, "total_files")
         assert hasattr(result, "total_chunks")
 
-    @pytest.mark.asyncio
-    @patch("app.services.search_service.SearchService._simple_text_search")
-    async def test_search_with_parameters(
-        self, mock_text_search: AsyncMock, search_service: SearchService
-    ) -> None:
+    @pytest.mark.usefixtures("mock_text_search")
+    async def test_search_with_parameters(self, search_service: SearchService) -> None:
         """Test search with custom parameters."""
-        # Setup mock - return empty list directly
-        mock_text_search.return_value = []
-
         # Execute test with parameters
         result = await search_service.search(
             query="test query", limit=5, score_threshold=0.8, file_path="/docs"
@@ -77,7 +77,6 @@ class TestSearchService:
         assert result.query == "test query"
         assert result.total_results == 0  # Empty list should give 0 results
 
-    @pytest.mark.asyncio
     async def test_search_empty_query(self, search_service: SearchService) -> None:
         """Test search with empty query."""
         # Execute test